@@ -1,12 +1,19 @@
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin
-from django.utils.html import format_html
+from django.contrib.postgres.search import SearchQuery, SearchVector
+from django.db import transaction
+from django.db.models import Count, Q
+from django.utils.html import format_html, format_html_join
 from .models import (
     EventUser, Vendor, VendorCategory, VendorUser, VendorAvailability, 
     VendorInquiry, VendorImage, Service, Package, PackageService, ServiceAvailability
 )
 
 
+# get_image_type_display() rebuilds the choices dict on every call; the gallery labels reuse this one
+IMAGE_TYPE_DISPLAY = dict(VendorImage._meta.get_field('image_type').flatchoices)
+
+
 @admin.register(EventUser)
 class EventUserAdmin(UserAdmin):
     """Enhanced admin for EventUser with Auth0 fields"""
@@ -56,6 +63,43 @@ class EventUserAdmin(UserAdmin):
     primary_role.short_description = 'Primary Role'
 
 
+class FullTextSearchMixin:
+    """
+    Admin search over short search_fields plus a full-text match on a large text column.
+    The column is matched through the same to_tsvector expression its GIN index is built on.
+    """
+    full_text_search_field = None
+    
+    def get_search_results(self, request, queryset, search_term):
+        queryset = queryset.alias(
+            _search=SearchVector(self.full_text_search_field, config='english')
+        )
+        results, may_have_duplicates = super().get_search_results(request, queryset, search_term)
+        if search_term:
+            results |= queryset.filter(
+                _search=SearchQuery(search_term, config='english', search_type='websearch')
+            )
+        return results, may_have_duplicates
+
+
+# Related rows each model's __str__ reads (Vendor -> category, Service/Package -> vendor)
+STR_SELECT_RELATED = {
+    Vendor: ('category',),
+    Service: ('vendor',),
+    Package: ('vendor',),
+}
+
+
+class StrSelectRelatedMixin:
+    """Join what __str__ needs into foreign key dropdowns instead of querying once per option"""
+    
+    def formfield_for_foreignkey(self, db_field, request, **kwargs):
+        related = STR_SELECT_RELATED.get(db_field.related_model)
+        if related and 'queryset' not in kwargs:
+            kwargs['queryset'] = db_field.related_model._default_manager.select_related(*related)
+        return super().formfield_for_foreignkey(db_field, request, **kwargs)
+
+
 @admin.register(VendorCategory)
 class VendorCategoryAdmin(admin.ModelAdmin):
     """Admin for vendor categories"""
@@ -67,8 +111,12 @@ class VendorCategoryAdmin(admin.ModelAdmin):
     readonly_fields = ['created_at']
     
     def vendor_count(self, obj):
-        return obj.vendors.count()
+        return obj._vendor_count
     vendor_count.short_description = 'Total Vendors'
+    vendor_count.admin_order_field = '_vendor_count'
+    
+    def get_queryset(self, request):
+        return super().get_queryset(request).annotate(_vendor_count=Count('vendors'))
 
 
 class VendorImageInline(admin.TabularInline):
@@ -91,8 +139,22 @@ class VendorImageInline(admin.TabularInline):
     image_preview.short_description = 'Preview'
 
 
+class VendorStateFilter(admin.SimpleListFilter):
+    """State filter backed by the cached Vendor.get_states() list instead of a DISTINCT per page"""
+    title = 'state'
+    parameter_name = 'state'
+    
+    def lookups(self, request, model_admin):
+        return [(state, state) for state in Vendor.get_states()]
+    
+    def queryset(self, request, queryset):
+        if self.value():
+            return queryset.filter(state=self.value())
+        return queryset
+
+
 @admin.register(Vendor)
-class VendorAdmin(admin.ModelAdmin):
+class VendorAdmin(FullTextSearchMixin, admin.ModelAdmin):
     """Enhanced admin for vendors with rich display"""
     
     list_display = [
@@ -102,12 +164,13 @@ class VendorAdmin(admin.ModelAdmin):
     
     list_filter = [
         'category', 'is_active', 'is_featured', 'is_verified', 
-        'pricing_structure', 'state', 'created_at'
+        'pricing_structure', VendorStateFilter, 'created_at'
     ]
     
     search_fields = [
-        'business_name', 'business_email', 'city', 'state', 'description'
+        'business_name', 'business_email', 'city', 'state'
     ]
+    full_text_search_field = 'description'
     
     readonly_fields = ['created_at', 'updated_at', 'price_range_display', 'image_gallery']
     
@@ -165,7 +228,7 @@ class VendorAdmin(admin.ModelAdmin):
     city_state.short_description = 'Location'
     
     def image_count(self, obj):
-        count = obj.images.count()
+        count = obj._image_count
         if count > 0:
             return format_html(
                 '<span style="color: green; font-weight: bold;">{}</span>',
@@ -175,28 +238,33 @@ class VendorAdmin(admin.ModelAdmin):
             '<span style="color: red;">0</span>'
         )
     image_count.short_description = 'Images'
+    image_count.admin_order_field = '_image_count'
     
     def image_gallery(self, obj):
         images = obj.images.filter(is_active=True).order_by('image_type', 'order')[:10]
         if images:
-            html = '<div style="display: flex; flex-wrap: wrap; gap: 10px;">'
-            for img in images:
-                if img.image_url:
-                    html += format_html(
-                        '<div style="text-align: center;">'
-                        '<img src="{}" width="150" height="150" style="object-fit: cover; border: 1px solid #ddd;" />'
-                        '<br><small>{}</small>'
-                        '</div>',
-                        img.image_url,
-                        img.get_image_type_display()
+            return format_html(
+                '<div style="display: flex; flex-wrap: wrap; gap: 10px;">{}</div>',
+                format_html_join(
+                    '',
+                    '<div style="text-align: center;">'
+                    '<img src="{}" width="150" height="150" style="object-fit: cover; border: 1px solid #ddd;" />'
+                    '<br><small>{}</small>'
+                    '</div>',
+                    (
+                        (img.image_url, IMAGE_TYPE_DISPLAY.get(img.image_type, img.image_type))
+                        for img in images if img.image_url
                     )
-            html += '</div>'
-            return format_html(html)
+                )
+            )
         return "No images uploaded"
     image_gallery.short_description = 'Image Gallery'
     
     def get_queryset(self, request):
-        return super().get_queryset(request).select_related('category', 'admin').prefetch_related('images')
+        # The changelist only needs the image count; the gallery runs its own capped query
+        return super().get_queryset(request).select_related('category', 'admin').annotate(
+            _image_count=Count('images')
+        )
 
 
 @admin.register(VendorUser)
@@ -207,6 +275,9 @@ class VendorUserAdmin(admin.ModelAdmin):
     list_filter = ['role', 'is_active', 'created_at']
     search_fields = ['vendor__business_name', 'user__email', 'user__first_name', 'user__last_name']
     readonly_fields = ['created_at']
+    
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('vendor__category', 'user')
 
 
 @admin.register(VendorAvailability)
@@ -217,10 +288,13 @@ class VendorAvailabilityAdmin(admin.ModelAdmin):
     list_filter = ['is_available', 'date', 'vendor__category']
     search_fields = ['vendor__business_name']
     date_hierarchy = 'date'
+    
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('vendor__category')
 
 
 @admin.register(VendorInquiry)
-class VendorInquiryAdmin(admin.ModelAdmin):
+class VendorInquiryAdmin(FullTextSearchMixin, admin.ModelAdmin):
     """Admin for vendor inquiries with status tracking"""
     
     list_display = [
@@ -235,10 +309,12 @@ class VendorInquiryAdmin(admin.ModelAdmin):
     
     search_fields = [
         'vendor__business_name', 'submitted_by__email', 
-        'event_location', 'message'
+        'event_location'
     ]
+    full_text_search_field = 'message'
     
     readonly_fields = ['created_at']
+    filter_horizontal = ['package_requested']
     date_hierarchy = 'event_date'
     
     fieldsets = (
@@ -270,10 +346,13 @@ class VendorInquiryAdmin(admin.ModelAdmin):
             return f"${obj.budget_range_low:,}+"
         return "Not specified"
     budget_range.short_description = 'Budget Range'
+    
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('vendor__category', 'submitted_by')
 
 
 @admin.register(Service)
-class ServiceAdmin(admin.ModelAdmin):
+class ServiceAdmin(StrSelectRelatedMixin, admin.ModelAdmin):
     """Admin for vendor services"""
     
     list_display = [
@@ -308,10 +387,13 @@ class ServiceAdmin(admin.ModelAdmin):
             'classes': ('collapse',)
         })
     )
+    
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('vendor__category', 'category')
 
 
 @admin.register(Package)
-class PackageAdmin(admin.ModelAdmin):
+class PackageAdmin(StrSelectRelatedMixin, admin.ModelAdmin):
     """Admin for vendor packages"""
     
     list_display = [
@@ -323,21 +405,30 @@ class PackageAdmin(admin.ModelAdmin):
     readonly_fields = ['created_at', 'updated_at']
     
     def service_count(self, obj):
-        return obj.packageservice_set.count()
+        return obj._service_count
     service_count.short_description = 'Services'
+    service_count.admin_order_field = '_service_count'
+    
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('vendor__category').annotate(
+            _service_count=Count('packageservice')
+        )
 
 
 @admin.register(PackageService)
-class PackageServiceAdmin(admin.ModelAdmin):
+class PackageServiceAdmin(StrSelectRelatedMixin, admin.ModelAdmin):
     """Admin for package-service relationships"""
     
     list_display = ['package', 'service', 'quantity', 'custom_price']
     list_filter = ['package__vendor', 'service__category']
     search_fields = ['package__name', 'service__name']
+    
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('package__vendor', 'service__vendor')
 
 
 @admin.register(ServiceAvailability)
-class ServiceAvailabilityAdmin(admin.ModelAdmin):
+class ServiceAvailabilityAdmin(StrSelectRelatedMixin, admin.ModelAdmin):
     """Admin for service availability"""
     
     list_display = [
@@ -347,10 +438,13 @@ class ServiceAvailabilityAdmin(admin.ModelAdmin):
     list_filter = ['date', 'service__vendor']
     search_fields = ['service__name', 'service__vendor__business_name']
     date_hierarchy = 'date'
+    
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('service__vendor')
 
 
 @admin.register(VendorImage)
-class VendorImageAdmin(admin.ModelAdmin):
+class VendorImageAdmin(FullTextSearchMixin, admin.ModelAdmin):
     """Standalone admin for managing all vendor images"""
     
     list_display = [
@@ -366,9 +460,9 @@ class VendorImageAdmin(admin.ModelAdmin):
     ]
     
     search_fields = [
-        'vendor__business_name', 'title', 'description', 
-        'tags', 'alt_text'
+        'vendor__business_name', 'title'
     ]
+    full_text_search_field = 'description'
     
     readonly_fields = [
         'image_preview_large', 'image_url', 'uploaded_at', 
@@ -427,7 +521,8 @@ class VendorImageAdmin(admin.ModelAdmin):
     display_locations_list.short_description = 'Display Locations'
     
     def get_queryset(self, request):
-        return super().get_queryset(request).select_related('vendor')
+        # Vendor.__str__ renders the category name as well
+        return super().get_queryset(request).select_related('vendor__category')
     
     actions = ['activate_images', 'deactivate_images', 'set_as_primary']
     
@@ -442,10 +537,23 @@ class VendorImageAdmin(admin.ModelAdmin):
     deactivate_images.short_description = 'Deactivate selected images'
     
     def set_as_primary(self, request, queryset):
-        for image in queryset:
-            image.is_primary = True
-            image.save()
-        self.message_user(request, f'{queryset.count()} images set as primary.')
+        # Only one primary per vendor and image type; as with save(), the last selected wins
+        chosen = {}
+        for pk, vendor_id, image_type in queryset.values_list('pk', 'vendor_id', 'image_type'):
+            chosen[(vendor_id, image_type)] = pk
+        if not chosen:
+            return
+        
+        same_slot = Q()
+        for vendor_id, image_type in chosen:
+            same_slot |= Q(vendor_id=vendor_id, image_type=image_type)
+        
+        with transaction.atomic():
+            VendorImage.objects.filter(same_slot, is_primary=True).exclude(
+                pk__in=chosen.values()
+            ).update(is_primary=False)
+            updated = VendorImage.objects.filter(pk__in=chosen.values()).update(is_primary=True)
+        self.message_user(request, f'{updated} images set as primary.')
     set_as_primary.short_description = 'Set as primary for their type'
 
 
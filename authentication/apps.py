@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class AuthenticationConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'authentication'
+
+    def ready(self):
+        # Registers the VendorUser signal handlers that evict cached vendor permissions
+        from . import auth0_permissions  # noqa: F401
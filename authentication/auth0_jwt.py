@@ -1,15 +1,74 @@
+import hashlib
 import jwt
 import json
 import requests
+import time
 from django.contrib.auth import get_user_model
 from django.conf import settings
+from django.db import IntegrityError, transaction
 from rest_framework import authentication, exceptions
 from rest_framework.authentication import BaseAuthentication
 from django.core.cache import cache
+from .auth0_permissions import prime_permission_sets
 
 
 User = get_user_model()
 
+JWKS_CACHE_TTL = 3600
+TOKEN_USER_CACHE_TTL = 300
+
+# Shared HTTPS connection pool for JWKS fetches
+_jwks_session = requests.Session()
+
+
+class SessionJWKClient(jwt.PyJWKClient):
+    """
+    PyJWKClient that fetches over a pooled session and revalidates with the JWKS ETag,
+    so an expired key set costs a 304 instead of a full download and re-parse
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._etag = None
+        self._jwk_set = None
+    
+    def fetch_data(self):
+        headers = {'If-None-Match': self._etag} if self._etag and self._jwk_set else {}
+        try:
+            response = _jwks_session.get(self.uri, headers=headers, timeout=self.timeout)
+            if response.status_code != 304:
+                response.raise_for_status()
+                self._jwk_set = response.json()
+                self._etag = response.headers.get('ETag')
+        except requests.RequestException as e:
+            raise jwt.PyJWKClientConnectionError(f'Fail to fetch data from the url, err: "{e}"')
+        
+        if self.jwk_set_cache is not None:
+            self.jwk_set_cache.put(self._jwk_set)
+        return self._jwk_set
+
+
+# One JWKS client per Auth0 domain; each keeps the JWKS and parsed keys in memory
+_jwk_clients = {}
+
+
+def get_jwk_client(auth0_domain):
+    """Return the per-worker JWKS client for an Auth0 domain"""
+    client = _jwk_clients.get(auth0_domain)
+    if client is None:
+        client = _jwk_clients[auth0_domain] = SessionJWKClient(
+            f'https://{auth0_domain}/.well-known/jwks.json',
+            cache_keys=True,
+            lifespan=JWKS_CACHE_TTL,
+            timeout=10,
+        )
+    return client
+
+
+def token_user_cache_key(token):
+    """Cache key mapping a verified bearer token to its user's pk"""
+    return f'auth0_user_{hashlib.sha256(token.encode()).hexdigest()[:32]}'
+
 
 class Auth0JSONWebTokenAuthentication(BaseAuthentication):
     """
@@ -34,10 +93,24 @@ class Auth0JSONWebTokenAuthentication(BaseAuthentication):
         except ValueError:
             return None
             
+        cache_key = token_user_cache_key(token)
         try:
+            # A token that was already verified and applied to its user only needs the user row
+            user_id = cache.get(cache_key)
+            if user_id is not None:
+                user = User.objects.filter(pk=user_id).first()
+                if user is not None:
+                    prime_permission_sets(user)
+                    return (user, token)
+            
             # Validate and decode the JWT token
             payload = self.decode_jwt(token)
             user = self.get_or_create_user(payload)
+            
+            # Never remember the token past its own expiry
+            ttl = min(TOKEN_USER_CACHE_TTL, int(payload.get('exp', 0) - time.time()))
+            if ttl > 0:
+                cache.set(cache_key, user.pk, ttl)
             return (user, token)
             
         except jwt.ExpiredSignatureError:
@@ -72,61 +145,9 @@ class Auth0JSONWebTokenAuthentication(BaseAuthentication):
     
     def get_signing_key(self, token, auth0_domain):
         """
-        Get the signing key from Auth0's JWKS endpoint
+        Get the signing key for the token's key ID from Auth0's JWKS endpoint
         """
-        # Cache key for JWKS data
-        cache_key = f'auth0_jwks_{auth0_domain}'
-        jwks = cache.get(cache_key)
-        
-        if not jwks:
-            # Fetch JWKS from Auth0
-            jwks_url = f'https://{auth0_domain}/.well-known/jwks.json'
-            response = requests.get(jwks_url, timeout=10)
-            response.raise_for_status()
-            jwks = response.json()
-            
-            # Cache for 1 hour
-            cache.set(cache_key, jwks, 3600)
-        
-        # Get the key ID from token header
-        unverified_header = jwt.get_unverified_header(token)
-        kid = unverified_header.get('kid')
-        
-        if not kid:
-            raise exceptions.AuthenticationFailed('Token missing key ID')
-            
-        # Find the matching key in JWKS
-        for key in jwks.get('keys', []):
-            if key.get('kid') == kid:
-                # Convert JWK to PEM format for PyJWT
-                from cryptography.hazmat.primitives.asymmetric import rsa
-                from cryptography.hazmat.primitives import serialization
-                import base64
-                
-                # Extract RSA key components
-                n = base64.urlsafe_b64decode(self._pad_base64(key['n']))
-                e = base64.urlsafe_b64decode(self._pad_base64(key['e']))
-                
-                # Create RSA public key
-                public_numbers = rsa.RSAPublicNumbers(
-                    int.from_bytes(e, 'big'),
-                    int.from_bytes(n, 'big')
-                )
-                public_key = public_numbers.public_key()
-                
-                # Convert to PEM format
-                pem_key = public_key.serialize(
-                    encoding=serialization.Encoding.PEM,
-                    format=serialization.PublicFormat.SubjectPublicKeyInfo
-                )
-                
-                return pem_key
-                
-        raise exceptions.AuthenticationFailed('Unable to find matching key')
-    
-    def _pad_base64(self, s):
-        """Add padding to base64 string if needed"""
-        return s + '=' * (4 - len(s) % 4)
+        return get_jwk_client(auth0_domain).get_signing_key_from_jwt(token).key
     
     def get_or_create_user(self, payload):
         """
@@ -149,7 +170,7 @@ class Auth0JSONWebTokenAuthentication(BaseAuthentication):
                     user = User.objects.get(email=email)
                     # Link Auth0 ID to existing user
                     user.auth0_user_id = auth0_user_id
-                    user.save()
+                    user.save(update_fields=['auth0_user_id'])
                 except User.DoesNotExist:
                     # Create new user
                     user = self.create_user_from_auth0(payload)
@@ -185,13 +206,18 @@ class Auth0JSONWebTokenAuthentication(BaseAuthentication):
             first_name = email.split('@')[0] if email else 'User'
             last_name = ''
         
-        user = User.objects.create_user(
-            username=email or auth0_user_id,  # Use email as username
-            email=email,
-            first_name=first_name,
-            last_name=last_name,
-            auth0_user_id=auth0_user_id
-        )
+        try:
+            with transaction.atomic():
+                user = User.objects.create_user(
+                    username=email or auth0_user_id,  # Use email as username
+                    email=email,
+                    first_name=first_name,
+                    last_name=last_name,
+                    auth0_user_id=auth0_user_id
+                )
+        except IntegrityError:
+            # A concurrent first request for the same Auth0 user won the insert
+            user = User.objects.get(auth0_user_id=auth0_user_id)
         
         return user
     
@@ -199,22 +225,30 @@ class Auth0JSONWebTokenAuthentication(BaseAuthentication):
         """
         Update user information from Auth0 JWT payload
         """
-        # Update Auth0-specific fields
-        user.auth0_roles = payload.get('https://shadi.com/roles', [])
-        user.auth0_permissions = payload.get('https://shadi.com/permissions', [])
+        # Only write the columns whose values actually changed; most requests change nothing
+        updates = {
+            'auth0_roles': payload.get('https://shadi.com/roles', []),
+            'auth0_permissions': payload.get('https://shadi.com/permissions', []),
+        }
         
         # Update picture if available
         picture = payload.get('picture')
         if picture:
-            user.auth0_picture = picture
+            updates['auth0_picture'] = picture
         
         # Update email verified status
         email_verified = payload.get('email_verified', False)
         if email_verified and not user.is_active:
-            user.is_active = True
+            updates['is_active'] = True
+        
+        changed_fields = [name for name, value in updates.items() if getattr(user, name) != value]
+        if changed_fields:
+            for name in changed_fields:
+                setattr(user, name, updates[name])
+            user.save(update_fields=changed_fields + ['updated_at'])
         
-        # Save changes
-        user.save()
+        # Roles/permissions may have just been replaced, so rebuild the sets checked by can_* helpers
+        prime_permission_sets(user)
     
     def authenticate_header(self, request):
         """
@@ -3,16 +3,64 @@ Auth0 Permission Management
 Handles Auth0 roles and permissions instead of hard-coded database fields
 """
 
+import asyncio
 import requests
 import logging
+import re
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from enum import StrEnum
+from asgiref.sync import sync_to_async
+from requests.adapters import HTTPAdapter
 from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Q
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
 from django.utils import timezone
 from typing import List, Dict, Any
+from urllib.parse import quote
 
 logger = logging.getLogger(__name__)
 
+# Refresh the Management API token this many seconds before Auth0 expires it
+MANAGEMENT_TOKEN_EXPIRY_BUFFER = 60
+
+# Only one thread per process fetches a fresh token; the rest wait for its result
+_management_token_lock = threading.Lock()
+MANAGEMENT_TOKEN_LOCK_TIMEOUT = 5
+
+# Shared session keeps connections to Auth0 alive between calls; the pool is sized so
+# every executor worker (and bulk-sync pipelining) reuses a warm TLS connection
+AUTH0_HTTP_TIMEOUT = 5
+AUTH0_HTTP_POOL_SIZE = 20
+_session = requests.Session()
+_session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=AUTH0_HTTP_POOL_SIZE))
+_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='auth0')
+
+# Users per round of concurrent Auth0 requests and per bulk_update batch
+BULK_SYNC_BATCH_SIZE = 50
+
+# Columns a permission sync writes; saving only these skips the rest of the user row
+AUTH0_SYNC_UPDATE_FIELDS = ['auth0_roles', 'auth0_permissions', 'last_auth0_sync', 'updated_at']
+
+# Auth0 user ids are "<provider>|<id>", e.g. auth0|abc123 or google-oauth2|1234
+AUTH0_USER_ID_RE = re.compile(r'^[\w.-]+\|\S+$')
+
+# How long an id that Auth0 answered 404 for is skipped by syncs
+UNKNOWN_USER_ID_CACHE_TTL = 3600
+
+# Per-process cache of (user_id, vendor_id) -> (expires_at, vendor access)
+VENDOR_PERMISSIONS_CACHE_TTL = 60
+VENDOR_PERMISSIONS_CACHE_MAXSIZE = 10000
+_vendor_permissions_cache = {}
+_vendor_permissions_cache_lock = threading.Lock()
+
 # Auth0 Permission Constants
-class Auth0Permissions:
+class Auth0Permissions(StrEnum):
     """Auth0 permission constants - these should match your Auth0 setup"""
     
     # Event Management
@@ -61,6 +109,24 @@ class Auth0Permissions:
     VIEW_WEDDING = 'view:wedding'
 
 
+# Every permission the app knows about, for validating synced data
+ALL_PERMISSIONS = frozenset(p.value for p in Auth0Permissions)
+
+# Pre-built bundles for has_all_permissions/has_any_permission
+VENDOR_EMPLOYEE_PERMISSIONS = frozenset({
+    Auth0Permissions.READ_VENDOR_INFO.value,
+    Auth0Permissions.MANAGE_VENDOR_BOOKINGS.value,
+    Auth0Permissions.RESPOND_VENDOR_INQUIRIES.value,
+})
+VENDOR_MANAGER_PERMISSIONS = VENDOR_EMPLOYEE_PERMISSIONS | {
+    Auth0Permissions.EDIT_VENDOR_INFO.value,
+    Auth0Permissions.VIEW_VENDOR_ANALYTICS.value,
+}
+VENDOR_OWNER_PERMISSIONS = VENDOR_MANAGER_PERMISSIONS | {
+    Auth0Permissions.MANAGE_VENDOR_TEAM.value,
+}
+
+
 class Auth0Roles:
     """Auth0 role constants - these should match your Auth0 setup"""
     
@@ -87,40 +153,167 @@ class Auth0VendorRoles:
     REPRESENTATIVE = 'Vendor Representative'
 
 
+def _get_permission_set(user) -> frozenset:
+    """Return the user's Auth0 permissions as a frozenset, cached on the user instance"""
+    perms = getattr(user, '_auth0_permissions_set', None)
+    if perms is None:
+        # Interned so set probes against the literal constants below match by identity
+        perms = frozenset(map(sys.intern, user.auth0_permissions or ()))
+        user._auth0_permissions_set = perms
+    return perms
+
+
+def _get_role_set(user) -> frozenset:
+    """Return the user's Auth0 roles as a frozenset, cached on the user instance"""
+    roles = getattr(user, '_auth0_roles_set', None)
+    if roles is None:
+        roles = frozenset(map(sys.intern, user.auth0_roles or ()))
+        user._auth0_roles_set = roles
+    return roles
+
+
+def clear_cached_permission_sets(user) -> None:
+    """Drop cached permission/role sets after user.auth0_permissions or auth0_roles change"""
+    user.__dict__.pop('_auth0_permissions_set', None)
+    user.__dict__.pop('_auth0_roles_set', None)
+
+
+def prime_permission_sets(user) -> None:
+    """Build the user's permission/role sets from the current auth0_* fields"""
+    clear_cached_permission_sets(user)
+    _get_permission_set(user)
+    _get_role_set(user)
+
+
 class Auth0PermissionChecker:
     """Utility class for checking Auth0 permissions"""
     
     @staticmethod
     def has_permission(user, permission: str) -> bool:
         """Check if user has a specific Auth0 permission"""
-        if not user.is_authenticated or not user.auth0_permissions:
+        if not user.is_authenticated:
             return False
         
-        return permission in user.auth0_permissions
+        return permission in _get_permission_set(user)
     
     @staticmethod
     def has_role(user, role: str) -> bool:
         """Check if user has a specific Auth0 role"""
-        if not user.is_authenticated or not user.auth0_roles:
+        if not user.is_authenticated:
             return False
         
-        return role in user.auth0_roles
+        return role in _get_role_set(user)
+    
+    @staticmethod
+    def has_any_role(user, roles) -> bool:
+        """Check if user has any of the specified Auth0 roles"""
+        if not user.is_authenticated:
+            return False
+        
+        return not _get_role_set(user).isdisjoint(roles)
     
     @staticmethod
     def has_any_permission(user, permissions: List[str]) -> bool:
         """Check if user has any of the specified permissions"""
-        if not user.is_authenticated or not user.auth0_permissions:
+        if not user.is_authenticated:
             return False
         
-        return any(perm in user.auth0_permissions for perm in permissions)
+        perms = _get_permission_set(user)
+        
+        # Most callers pass a single permission; skip building an iterator for it
+        if isinstance(permissions, (list, tuple)) and len(permissions) == 1:
+            return permissions[0] in perms
+        return not perms.isdisjoint(permissions)
     
     @staticmethod
     def has_all_permissions(user, permissions: List[str]) -> bool:
         """Check if user has all of the specified permissions"""
-        if not user.is_authenticated or not user.auth0_permissions:
+        if not user.is_authenticated:
+            return False
+        
+        perms = _get_permission_set(user)
+        if not perms:
             return False
         
-        return all(perm in user.auth0_permissions for perm in permissions)
+        if isinstance(permissions, frozenset):
+            return perms >= permissions
+        if isinstance(permissions, (list, tuple)) and len(permissions) == 1:
+            return permissions[0] in perms
+        return perms.issuperset(permissions)
+
+
+def _get_vendor_user(user, vendor):
+    """Return the user's active VendorUser row for vendor (or None), memoized on the user"""
+    vendor_users = user.__dict__.setdefault('_vendor_user_cache', {})
+    vendor_id = getattr(vendor, 'pk', vendor)
+    
+    if vendor_id not in vendor_users:
+        # first() returns None on a miss, so denied checks don't pay for an exception
+        vendor_users[vendor_id] = user.managed_vendors.select_related('vendor').filter(
+            vendor=vendor, is_active=True
+        ).first()
+    
+    return vendor_users[vendor_id]
+
+
+def _cached_vendor_access(key):
+    """Return (hit, access) for a (user_id, vendor_id) key from the TTL cache"""
+    with _vendor_permissions_cache_lock:
+        entry = _vendor_permissions_cache.get(key)
+    if entry and entry[0] > time.monotonic():
+        return True, entry[1]
+    return False, None
+
+
+def _store_vendor_access(key, vendor_user):
+    """Cache (role, permissions frozenset) for a VendorUser row, or None for no membership"""
+    access = None
+    if vendor_user is not None:
+        access = (vendor_user.role, frozenset(vendor_user.get_vendor_permissions()))
+    
+    with _vendor_permissions_cache_lock:
+        if len(_vendor_permissions_cache) >= VENDOR_PERMISSIONS_CACHE_MAXSIZE:
+            _vendor_permissions_cache.clear()
+        _vendor_permissions_cache[key] = (time.monotonic() + VENDOR_PERMISSIONS_CACHE_TTL, access)
+    
+    return access
+
+
+def _get_vendor_access(user, vendor):
+    """Return (role, permissions frozenset) for the user's vendor membership, or None"""
+    key = (user.pk, getattr(vendor, 'pk', vendor))
+    hit, access = _cached_vendor_access(key)
+    if hit:
+        return access
+    
+    return _store_vendor_access(key, _get_vendor_user(user, vendor))
+
+
+async def _aget_vendor_access(user, vendor):
+    """Async version of _get_vendor_access for use from async views"""
+    key = (user.pk, getattr(vendor, 'pk', vendor))
+    hit, access = _cached_vendor_access(key)
+    if hit:
+        return access
+    
+    vendor_users = user.__dict__.setdefault('_vendor_user_cache', {})
+    if key[1] not in vendor_users:
+        vendor_users[key[1]] = await user.managed_vendors.select_related('vendor').filter(
+            vendor=vendor, is_active=True
+        ).afirst()
+    
+    return _store_vendor_access(key, vendor_users[key[1]])
+
+
+def invalidate_vendor_permissions(user_id, vendor_id) -> None:
+    """Evict a cached vendor membership so the next check reloads it"""
+    with _vendor_permissions_cache_lock:
+        _vendor_permissions_cache.pop((user_id, vendor_id), None)
+
+
+@receiver([post_save, post_delete], sender='authentication.VendorUser')
+def _evict_vendor_permissions(sender, instance, **kwargs):
+    invalidate_vendor_permissions(instance.user_id, instance.vendor_id)
 
 
 class Auth0VendorPermissionChecker:
@@ -134,12 +327,11 @@ class Auth0VendorPermissionChecker:
         
         # For now, check if user is associated with the vendor and has the permission
         # In future, this should check Auth0 Organizations and scoped permissions
-        try:
-            vendor_user = user.managed_vendors.get(vendor=vendor, is_active=True)
-            vendor_permissions = vendor_user.get_vendor_permissions()
-            return permission in vendor_permissions
-        except:
+        access = _get_vendor_access(user, vendor)
+        if access is None:
             return False
+        
+        return permission in access[1]
     
     @staticmethod 
     def has_vendor_role(user, vendor, role: str) -> bool:
@@ -147,11 +339,11 @@ class Auth0VendorPermissionChecker:
         if not user.is_authenticated:
             return False
         
-        try:
-            vendor_user = user.managed_vendors.get(vendor=vendor, is_active=True)
-            return vendor_user.role == role
-        except:
+        access = _get_vendor_access(user, vendor)
+        if access is None:
             return False
+        
+        return access[0] == role
     
     @staticmethod
     def get_vendor_permissions(user, vendor) -> List[str]:
@@ -159,11 +351,47 @@ class Auth0VendorPermissionChecker:
         if not user.is_authenticated:
             return []
         
-        try:
-            vendor_user = user.managed_vendors.get(vendor=vendor, is_active=True)
-            return vendor_user.get_vendor_permissions()
-        except:
+        access = _get_vendor_access(user, vendor)
+        if access is None:
             return []
+        
+        return sorted(access[1])
+    
+    @staticmethod
+    async def ahas_vendor_permission(user, vendor, permission: str) -> bool:
+        """Async version of has_vendor_permission"""
+        if not user.is_authenticated:
+            return False
+        
+        access = await _aget_vendor_access(user, vendor)
+        if access is None:
+            return False
+        
+        return permission in access[1]
+    
+    @staticmethod
+    async def ahas_vendor_role(user, vendor, role: str) -> bool:
+        """Async version of has_vendor_role"""
+        if not user.is_authenticated:
+            return False
+        
+        access = await _aget_vendor_access(user, vendor)
+        if access is None:
+            return False
+        
+        return access[0] == role
+    
+    @staticmethod
+    async def aget_vendor_permissions(user, vendor) -> List[str]:
+        """Async version of get_vendor_permissions"""
+        if not user.is_authenticated:
+            return []
+        
+        access = await _aget_vendor_access(user, vendor)
+        if access is None:
+            return []
+        
+        return sorted(access[1])
 
 
 class Auth0UserSync:
@@ -174,12 +402,50 @@ class Auth0UserSync:
         self.client_id = settings.AUTH0_CLIENT_ID
         self.client_secret = settings.AUTH0_CLIENT_SECRET
         self._management_token = None
+        self._management_token_expires_at = 0
+        self._headers = (None, None)
+        
+        # Built once; per-user URLs are a single %-substitution
+        self._roles_url_tmpl = f"https://{self.domain}/api/v2/users/%s/roles"
+        self._permissions_url_tmpl = f"https://{self.domain}/api/v2/users/%s/permissions"
     
-    def get_management_token(self) -> str:
-        """Get Auth0 Management API token"""
-        if self._management_token:
+    @property
+    def management_token_cache_key(self) -> str:
+        return f"auth0:mgmt_token:{self.domain}:{self.client_id}"
+    
+    def _get_cached_management_token(self):
+        """Return a still-valid token from the instance or shared cache, if any"""
+        now = time.time()
+        if self._management_token and now + MANAGEMENT_TOKEN_EXPIRY_BUFFER < self._management_token_expires_at:
+            return self._management_token
+        
+        # Shared cache so every worker reuses the same token
+        cached = cache.get(self.management_token_cache_key)
+        if cached and now + MANAGEMENT_TOKEN_EXPIRY_BUFFER < cached[1]:
+            self._management_token, self._management_token_expires_at = cached
             return self._management_token
         
+        return None
+    
+    def get_management_token(self) -> str:
+        """Get Auth0 Management API token, reusing it until shortly before it expires"""
+        token = self._get_cached_management_token()
+        if token:
+            return token
+        
+        # Coalesce concurrent misses into a single /oauth/token request
+        acquired = _management_token_lock.acquire(timeout=MANAGEMENT_TOKEN_LOCK_TIMEOUT)
+        try:
+            token = self._get_cached_management_token()
+            if token:
+                return token
+            return self._fetch_management_token()
+        finally:
+            if acquired:
+                _management_token_lock.release()
+    
+    def _fetch_management_token(self) -> str:
+        """Request a new Management API token from Auth0 and cache it"""
         url = f"https://{self.domain}/oauth/token"
         
         payload = {
@@ -190,61 +456,138 @@ class Auth0UserSync:
         }
         
         try:
-            response = requests.post(url, json=payload)
+            response = _session.post(url, json=payload, timeout=AUTH0_HTTP_TIMEOUT)
             response.raise_for_status()
             
             data = response.json()
+            expires_in = int(data.get('expires_in', 86400))
             self._management_token = data['access_token']
+            self._management_token_expires_at = time.time() + expires_in
+            
+            cache.set(
+                self.management_token_cache_key,
+                (self._management_token, self._management_token_expires_at),
+                timeout=max(expires_in - MANAGEMENT_TOKEN_EXPIRY_BUFFER, 1)
+            )
             return self._management_token
             
         except requests.RequestException as e:
             logger.error(f"Failed to get Auth0 management token: {e}")
             raise
     
-    def get_user_roles_and_permissions(self, auth0_user_id: str) -> Dict[str, Any]:
-        """Get user's roles and permissions from Auth0"""
-        token = self.get_management_token()
+    def _management_headers(self, token: str) -> Dict[str, str]:
+        """Management API request headers, rebuilt only when the token changes"""
+        headers_token, headers = self._headers
+        if token != headers_token:
+            headers = {
+                'Authorization': f'Bearer {token}',
+                'Content-Type': 'application/json'
+            }
+            self._headers = (token, headers)
+        return headers
+    
+    def _unknown_user_id_cache_key(self, auth0_user_id: str) -> str:
+        return f"auth0:unknown_user:{self.domain}:{auth0_user_id}"
+    
+    def is_syncable_user_id(self, auth0_user_id: str) -> bool:
+        """Check the id is well-formed and Auth0 hasn't recently reported it missing"""
+        if not auth0_user_id or not AUTH0_USER_ID_RE.match(auth0_user_id):
+            return False
+        return not cache.get(self._unknown_user_id_cache_key(auth0_user_id))
+    
+    def _remember_unknown_user_id(self, auth0_user_id: str, error: requests.RequestException) -> None:
+        """Skip ids Auth0 answered 404 for until UNKNOWN_USER_ID_CACHE_TTL passes"""
+        response = getattr(error, 'response', None)
+        if response is not None and response.status_code == 404:
+            cache.set(self._unknown_user_id_cache_key(auth0_user_id), True, UNKNOWN_USER_ID_CACHE_TTL)
+    
+    def _request_roles_and_permissions(self, auth0_user_id: str, headers: Dict[str, str]):
+        """Submit the roles and permissions GETs for a user, returning their futures"""
+        # Provider ids contain '|', which must be escaped in the path
+        user_path = quote(auth0_user_id, safe='')
+        roles_url = self._roles_url_tmpl % user_path
+        permissions_url = self._permissions_url_tmpl % user_path
+        
+        return (
+            _executor.submit(_session.get, roles_url, headers=headers, timeout=AUTH0_HTTP_TIMEOUT),
+            _executor.submit(_session.get, permissions_url, headers=headers, timeout=AUTH0_HTTP_TIMEOUT),
+        )
+    
+    @staticmethod
+    def _parse_roles_and_permissions(roles_response, perms_response) -> Dict[str, Any]:
+        roles_response.raise_for_status()
+        roles = [sys.intern(role['name']) for role in roles_response.json()]
+        
+        perms_response.raise_for_status()
+        permissions = [sys.intern(perm['permission_name']) for perm in perms_response.json()]
         
-        headers = {
-            'Authorization': f'Bearer {token}',
-            'Content-Type': 'application/json'
+        return {
+            'roles': roles,
+            'permissions': permissions
         }
+    
+    def _fetch_roles_and_permissions(self, auth0_user_id: str) -> Dict[str, Any]:
+        """Fetch a user's roles and permissions, raising requests.RequestException on failure"""
+        token = self.get_management_token()
+        
+        headers = self._management_headers(token)
         
         try:
-            # Get user roles
-            roles_url = f"https://{self.domain}/api/v2/users/{auth0_user_id}/roles"
-            roles_response = requests.get(roles_url, headers=headers)
-            roles_response.raise_for_status()
-            roles = [role['name'] for role in roles_response.json()]
+            # Fetch roles and permissions concurrently
+            roles_future, perms_future = self._request_roles_and_permissions(auth0_user_id, headers)
+            return self._parse_roles_and_permissions(roles_future.result(), perms_future.result())
             
-            # Get user permissions
-            permissions_url = f"https://{self.domain}/api/v2/users/{auth0_user_id}/permissions"
-            perms_response = requests.get(permissions_url, headers=headers)
-            perms_response.raise_for_status()
-            permissions = [perm['permission_name'] for perm in perms_response.json()]
-            
-            return {
-                'roles': roles,
-                'permissions': permissions
-            }
+        except requests.RequestException as e:
+            logger.error(f"Failed to fetch Auth0 roles/permissions for {auth0_user_id}: {e}")
+            self._remember_unknown_user_id(auth0_user_id, e)
+            raise
+    
+    async def _afetch_roles_and_permissions(self, auth0_user_id: str) -> Dict[str, Any]:
+        """Async version of _fetch_roles_and_permissions"""
+        token = await sync_to_async(self.get_management_token)()
+        
+        headers = self._management_headers(token)
+        
+        try:
+            # Await both requests together instead of parking a thread on each result()
+            roles_future, perms_future = self._request_roles_and_permissions(auth0_user_id, headers)
+            roles_response, perms_response = await asyncio.gather(
+                asyncio.wrap_future(roles_future),
+                asyncio.wrap_future(perms_future),
+            )
+            return self._parse_roles_and_permissions(roles_response, perms_response)
             
         except requests.RequestException as e:
             logger.error(f"Failed to fetch Auth0 roles/permissions for {auth0_user_id}: {e}")
+            self._remember_unknown_user_id(auth0_user_id, e)
+            raise
+    
+    def get_user_roles_and_permissions(self, auth0_user_id: str) -> Dict[str, Any]:
+        """Get user's roles and permissions from Auth0"""
+        if not self.is_syncable_user_id(auth0_user_id):
+            logger.warning(f"Skipping Auth0 roles/permissions fetch for invalid or unknown id {auth0_user_id}")
+            return {'roles': [], 'permissions': []}
+        
+        try:
+            return self._fetch_roles_and_permissions(auth0_user_id)
+        except requests.RequestException:
             return {'roles': [], 'permissions': []}
     
     def sync_user_permissions(self, user) -> bool:
         """Sync user's Auth0 roles and permissions to local database"""
-        if not user.auth0_user_id:
-            logger.warning(f"Cannot sync permissions for user {user.email}: no Auth0 ID")
+        # A failed or skipped fetch leaves the stored roles alone instead of emptying them
+        if not self.is_syncable_user_id(user.auth0_user_id):
+            logger.warning(f"Cannot sync permissions for user {user.email}: no valid Auth0 ID")
             return False
         
         try:
-            auth0_data = self.get_user_roles_and_permissions(user.auth0_user_id)
+            auth0_data = self._fetch_roles_and_permissions(user.auth0_user_id)
             
             user.auth0_roles = auth0_data['roles']
             user.auth0_permissions = auth0_data['permissions']
             user.last_auth0_sync = timezone.now()
-            user.save()
+            clear_cached_permission_sets(user)
+            user.save(update_fields=AUTH0_SYNC_UPDATE_FIELDS)
             
             logger.info(f"Synced Auth0 permissions for user {user.email}")
             return True
@@ -252,82 +595,206 @@ class Auth0UserSync:
         except Exception as e:
             logger.error(f"Failed to sync Auth0 permissions for user {user.email}: {e}")
             return False
+    
+    async def aget_user_roles_and_permissions(self, auth0_user_id: str) -> Dict[str, Any]:
+        """Async version of get_user_roles_and_permissions"""
+        if not self.is_syncable_user_id(auth0_user_id):
+            logger.warning(f"Skipping Auth0 roles/permissions fetch for invalid or unknown id {auth0_user_id}")
+            return {'roles': [], 'permissions': []}
+        
+        try:
+            return await self._afetch_roles_and_permissions(auth0_user_id)
+        except requests.RequestException:
+            return {'roles': [], 'permissions': []}
+    
+    async def async_user_permissions(self, user) -> bool:
+        """Async version of sync_user_permissions ('a' + sync_user_permissions, like the other a-methods)"""
+        if not self.is_syncable_user_id(user.auth0_user_id):
+            logger.warning(f"Cannot sync permissions for user {user.email}: no valid Auth0 ID")
+            return False
+        
+        try:
+            auth0_data = await self._afetch_roles_and_permissions(user.auth0_user_id)
+            
+            user.auth0_roles = auth0_data['roles']
+            user.auth0_permissions = auth0_data['permissions']
+            user.last_auth0_sync = timezone.now()
+            clear_cached_permission_sets(user)
+            await user.asave(update_fields=AUTH0_SYNC_UPDATE_FIELDS)
+            
+            logger.info(f"Synced Auth0 permissions for user {user.email}")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Failed to sync Auth0 permissions for user {user.email}: {e}")
+            return False
+    
+    def sync_users_bulk(self, users) -> int:
+        """Sync Auth0 roles and permissions for many users, writing them back in one bulk update"""
+        users = [user for user in users if self.is_syncable_user_id(user.auth0_user_id)]
+        if not users:
+            return 0
+        
+        token = self.get_management_token()
+        
+        headers = self._management_headers(token)
+        
+        synced = []
+        now = timezone.now()
+        
+        for start in range(0, len(users), BULK_SYNC_BATCH_SIZE):
+            batch = users[start:start + BULK_SYNC_BATCH_SIZE]
+            
+            # Queue every request in the batch before waiting on any of them
+            pending = [
+                (user, self._request_roles_and_permissions(user.auth0_user_id, headers))
+                for user in batch
+            ]
+            
+            for user, (roles_future, perms_future) in pending:
+                try:
+                    auth0_data = self._parse_roles_and_permissions(roles_future.result(), perms_future.result())
+                except requests.RequestException as e:
+                    logger.error(f"Failed to fetch Auth0 roles/permissions for {user.auth0_user_id}: {e}")
+                    self._remember_unknown_user_id(user.auth0_user_id, e)
+                    continue
+                
+                user.auth0_roles = auth0_data['roles']
+                user.auth0_permissions = auth0_data['permissions']
+                user.last_auth0_sync = now
+                # bulk_update skips auto_now, so stamp updated_at like save() would
+                user.updated_at = now
+                clear_cached_permission_sets(user)
+                synced.append(user)
+        
+        if synced:
+            type(synced[0]).objects.bulk_update(
+                synced,
+                AUTH0_SYNC_UPDATE_FIELDS,
+                batch_size=BULK_SYNC_BATCH_SIZE
+            )
+        
+        logger.info(f"Bulk synced Auth0 permissions for {len(synced)} of {len(users)} users")
+        return len(synced)
+    
+    def sync_stale_users(self, max_age: timedelta = timedelta(hours=1)) -> int:
+        """Sync every user whose Auth0 data is older than max_age (or was never synced)"""
+        from django.contrib.auth import get_user_model
+        
+        User = get_user_model()
+        cutoff = timezone.now() - max_age
+        
+        users = User.objects.filter(
+            auth0_user_id__isnull=False
+        ).filter(
+            Q(last_auth0_sync__isnull=True) | Q(last_auth0_sync__lt=cutoff)
+        ).only('id', 'auth0_user_id', 'auth0_roles', 'auth0_permissions', 'last_auth0_sync')
+        
+        return self.sync_users_bulk(list(users))
 
 
-# Convenience functions for common permission checks
-def can_create_events(user) -> bool:
-    """Check if user can create events"""
-    return Auth0PermissionChecker.has_permission(user, Auth0Permissions.CREATE_EVENTS)
-
-def can_manage_vendor_relationships(user) -> bool:
-    """Check if user can manage vendor relationships (couples/planners)"""
-    return Auth0PermissionChecker.has_permission(user, Auth0Permissions.MANAGE_VENDOR_RELATIONSHIPS)
-
-def can_view_vendors(user) -> bool:
-    """Check if user can view vendor listings"""
-    return Auth0PermissionChecker.has_permission(user, Auth0Permissions.VIEW_VENDORS)
-
-def can_inquire_vendors(user) -> bool:
-    """Check if user can send inquiries to vendors"""
-    return Auth0PermissionChecker.has_permission(user, Auth0Permissions.INQUIRE_VENDORS)
+_user_sync = None
+_user_sync_lock = threading.Lock()
 
-def can_manage_vendor_business(user) -> bool:
-    """Check if user can manage vendor business (vendor representatives)"""
-    return Auth0PermissionChecker.has_permission(user, Auth0Permissions.MANAGE_VENDOR_BUSINESS)
 
-def can_respond_to_inquiries(user) -> bool:
-    """Check if user can respond to vendor inquiries"""
-    return Auth0PermissionChecker.has_permission(user, Auth0Permissions.RESPOND_TO_INQUIRIES)
+def get_user_sync() -> Auth0UserSync:
+    """Process-wide Auth0UserSync, so the management token and headers are shared"""
+    global _user_sync
+    if _user_sync is None:
+        with _user_sync_lock:
+            if _user_sync is None:
+                _user_sync = Auth0UserSync()
+    return _user_sync
 
-def can_manage_guests(user) -> bool:
-    """Check if user can manage guests"""
-    return Auth0PermissionChecker.has_permission(user, Auth0Permissions.MANAGE_GUESTS)
 
-def can_edit_schedules(user) -> bool:
-    """Check if user can edit schedules"""
-    return Auth0PermissionChecker.has_permission(user, Auth0Permissions.EDIT_SCHEDULES)
+# Convenience functions for common permission checks
+def _mk_permission_check(permission: str, name: str, doc: str):
+    """Build a can_* check that tests one permission against the user's cached set"""
+    permission = sys.intern(str(permission))
+    
+    def check(user) -> bool:
+        return user.is_authenticated and permission in _get_permission_set(user)
+    
+    check.__name__ = check.__qualname__ = name
+    check.__doc__ = doc
+    return check
 
-def can_access_analytics(user) -> bool:
-    """Check if user can access analytics"""
-    return Auth0PermissionChecker.has_permission(user, Auth0Permissions.ACCESS_ANALYTICS)
 
-def can_manage_payments(user) -> bool:
-    """Check if user can manage payments"""
-    return Auth0PermissionChecker.has_permission(user, Auth0Permissions.MANAGE_PAYMENTS)
+def _mk_vendor_permission_check(permission: str, name: str, doc: str):
+    """Build a vendor-scoped can_* check for one permission"""
+    permission = sys.intern(str(permission))
+    
+    def check(user, vendor) -> bool:
+        if not user.is_authenticated:
+            return False
+        access = _get_vendor_access(user, vendor)
+        return access is not None and permission in access[1]
+    
+    check.__name__ = check.__qualname__ = name
+    check.__doc__ = doc
+    return check
+
+
+can_create_events = _mk_permission_check(
+    Auth0Permissions.CREATE_EVENTS, 'can_create_events',
+    "Check if user can create events")
+can_manage_vendor_relationships = _mk_permission_check(
+    Auth0Permissions.MANAGE_VENDOR_RELATIONSHIPS, 'can_manage_vendor_relationships',
+    "Check if user can manage vendor relationships (couples/planners)")
+can_view_vendors = _mk_permission_check(
+    Auth0Permissions.VIEW_VENDORS, 'can_view_vendors',
+    "Check if user can view vendor listings")
+can_inquire_vendors = _mk_permission_check(
+    Auth0Permissions.INQUIRE_VENDORS, 'can_inquire_vendors',
+    "Check if user can send inquiries to vendors")
+can_manage_vendor_business = _mk_permission_check(
+    Auth0Permissions.MANAGE_VENDOR_BUSINESS, 'can_manage_vendor_business',
+    "Check if user can manage vendor business (vendor representatives)")
+can_respond_to_inquiries = _mk_permission_check(
+    Auth0Permissions.RESPOND_TO_INQUIRIES, 'can_respond_to_inquiries',
+    "Check if user can respond to vendor inquiries")
+can_manage_guests = _mk_permission_check(
+    Auth0Permissions.MANAGE_GUESTS, 'can_manage_guests',
+    "Check if user can manage guests")
+can_edit_schedules = _mk_permission_check(
+    Auth0Permissions.EDIT_SCHEDULES, 'can_edit_schedules',
+    "Check if user can edit schedules")
+can_access_analytics = _mk_permission_check(
+    Auth0Permissions.ACCESS_ANALYTICS, 'can_access_analytics',
+    "Check if user can access analytics")
+can_manage_payments = _mk_permission_check(
+    Auth0Permissions.MANAGE_PAYMENTS, 'can_manage_payments',
+    "Check if user can manage payments")
+has_wedding_planning_access = _mk_permission_check(
+    Auth0Permissions.PLAN_WEDDING, 'has_wedding_planning_access',
+    "Check if user has wedding planning access")
+
+_COUPLE_ROLES = frozenset({Auth0Roles.BRIDE, Auth0Roles.GROOM})
 
 def is_bride_or_groom(user) -> bool:
     """Check if user is bride or groom"""
-    return (Auth0PermissionChecker.has_role(user, Auth0Roles.BRIDE) or 
-            Auth0PermissionChecker.has_role(user, Auth0Roles.GROOM))
+    return user.is_authenticated and not _get_role_set(user).isdisjoint(_COUPLE_ROLES)
 
 def is_vendor_representative(user) -> bool:
     """Check if user is a vendor representative"""
     return Auth0PermissionChecker.has_role(user, Auth0Roles.VENDOR_REPRESENTATIVE)
 
-def has_wedding_planning_access(user) -> bool:
-    """Check if user has wedding planning access"""
-    return Auth0PermissionChecker.has_permission(user, Auth0Permissions.PLAN_WEDDING)
-
 # Vendor-specific permission functions
-def can_edit_vendor_info(user, vendor) -> bool:
-    """Check if user can edit vendor business information"""
-    return Auth0VendorPermissionChecker.has_vendor_permission(user, vendor, Auth0Permissions.EDIT_VENDOR_INFO)
-
-def can_manage_vendor_bookings(user, vendor) -> bool:
-    """Check if user can manage bookings for vendor"""
-    return Auth0VendorPermissionChecker.has_vendor_permission(user, vendor, Auth0Permissions.MANAGE_VENDOR_BOOKINGS)
-
-def can_respond_vendor_inquiries(user, vendor) -> bool:
-    """Check if user can respond to inquiries for vendor"""
-    return Auth0VendorPermissionChecker.has_vendor_permission(user, vendor, Auth0Permissions.RESPOND_VENDOR_INQUIRIES)
-
-def can_view_vendor_analytics(user, vendor) -> bool:
-    """Check if user can view vendor analytics"""
-    return Auth0VendorPermissionChecker.has_vendor_permission(user, vendor, Auth0Permissions.VIEW_VENDOR_ANALYTICS)
-
-def can_manage_vendor_team(user, vendor) -> bool:
-    """Check if user can manage vendor team members"""
-    return Auth0VendorPermissionChecker.has_vendor_permission(user, vendor, Auth0Permissions.MANAGE_VENDOR_TEAM)
+can_edit_vendor_info = _mk_vendor_permission_check(
+    Auth0Permissions.EDIT_VENDOR_INFO, 'can_edit_vendor_info',
+    "Check if user can edit vendor business information")
+can_manage_vendor_bookings = _mk_vendor_permission_check(
+    Auth0Permissions.MANAGE_VENDOR_BOOKINGS, 'can_manage_vendor_bookings',
+    "Check if user can manage bookings for vendor")
+can_respond_vendor_inquiries = _mk_vendor_permission_check(
+    Auth0Permissions.RESPOND_VENDOR_INQUIRIES, 'can_respond_vendor_inquiries',
+    "Check if user can respond to inquiries for vendor")
+can_view_vendor_analytics = _mk_vendor_permission_check(
+    Auth0Permissions.VIEW_VENDOR_ANALYTICS, 'can_view_vendor_analytics',
+    "Check if user can view vendor analytics")
+can_manage_vendor_team = _mk_vendor_permission_check(
+    Auth0Permissions.MANAGE_VENDOR_TEAM, 'can_manage_vendor_team',
+    "Check if user can manage vendor team members")
 
 def is_vendor_owner(user, vendor) -> bool:
     """Check if user is owner of vendor"""
@@ -338,6 +805,6 @@ def is_vendor_manager(user, vendor) -> bool:
     return Auth0VendorPermissionChecker.has_vendor_role(user, vendor, 'manager')
 
 # Legacy support - update these to use new vendor permissions
-def can_manage_vendors(user) -> bool:
-    """Legacy function - use can_manage_vendor_relationships instead"""
-    return can_manage_vendor_relationships(user)
\ No newline at end of file
+can_manage_vendors = _mk_permission_check(
+    Auth0Permissions.MANAGE_VENDOR_RELATIONSHIPS, 'can_manage_vendors',
+    "Legacy function - use can_manage_vendor_relationships instead")
\ No newline at end of file
@@ -1,5 +1,6 @@
 from django.contrib.auth.backends import ModelBackend
 from django.contrib.auth import get_user_model
+from django.db.models import Case, Q, Value, When
 
 User = get_user_model()
 
@@ -17,24 +18,20 @@ class EmailOrUsernameBackend(ModelBackend):
         if username is None or password is None:
             return None
         
-        # Try to find user by email first, then by username
-        user = None
+        # One query for either identifier; an email match takes precedence over a username match
+        user = User.objects.filter(
+            Q(email__iexact=username) | Q(username__iexact=username)
+        ).order_by(
+            Case(When(email__iexact=username, then=Value(0)), default=Value(1)), 'pk'
+        ).first()
         
-        # Try email authentication
-        try:
-            user = User.objects.get(email__iexact=username)
-        except User.DoesNotExist:
-            pass
-        
-        # If not found by email, try username
         if user is None:
-            try:
-                user = User.objects.get(username__iexact=username)
-            except User.DoesNotExist:
-                return None
+            # Run the password hasher anyway so a missing account takes as long as a wrong password
+            User().set_password(password)
+            return None
         
         # Check password
-        if user and user.check_password(password) and self.user_can_authenticate(user):
+        if user.check_password(password) and self.user_can_authenticate(user):
             return user
         
         return None
\ No newline at end of file
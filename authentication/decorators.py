@@ -5,6 +5,7 @@ from rest_framework.decorators import permission_classes
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework import status
+from .auth0_permissions import Auth0PermissionChecker
 
 
 def require_auth0_permission(permission):
@@ -18,7 +19,7 @@ def require_auth0_permission(permission):
             if not request.user.is_authenticated:
                 return JsonResponse({'error': 'Authentication required'}, status=401)
             
-            if not request.user.has_auth0_permission(permission):
+            if not Auth0PermissionChecker.has_permission(request.user, permission):
                 return JsonResponse({
                     'error': f'Permission denied. Required permission: {permission}'
                 }, status=403)
@@ -39,7 +40,7 @@ def require_auth0_role(role):
             if not request.user.is_authenticated:
                 return JsonResponse({'error': 'Authentication required'}, status=401)
             
-            if not request.user.has_auth0_role(role):
+            if not Auth0PermissionChecker.has_role(request.user, role):
                 return JsonResponse({
                     'error': f'Access denied. Required role: {role}'
                 }, status=403)
@@ -54,16 +55,18 @@ def require_any_auth0_role(roles):
     Decorator to check if user has any of the specified Auth0 roles
     Usage: @require_any_auth0_role(['vendor_admin', 'super_admin'])
     """
+    # Built once per decorated view rather than on every denied request
+    roles_set = frozenset(roles)
+    denied_message = f'Access denied. Required roles: {", ".join(roles)}'
+    
     def decorator(view_func):
         @wraps(view_func)
         def wrapper(request, *args, **kwargs):
             if not request.user.is_authenticated:
                 return JsonResponse({'error': 'Authentication required'}, status=401)
             
-            if not any(request.user.has_auth0_role(role) for role in roles):
-                return JsonResponse({
-                    'error': f'Access denied. Required roles: {", ".join(roles)}'
-                }, status=403)
+            if not Auth0PermissionChecker.has_any_role(request.user, roles_set):
+                return JsonResponse({'error': denied_message}, status=403)
             
             return view_func(request, *args, **kwargs)
         return wrapper
@@ -84,7 +87,7 @@ class HasAuth0Permission(BasePermission):
     def has_permission(self, request, view):
         if not request.user.is_authenticated:
             return False
-        return request.user.has_auth0_permission(self.permission)
+        return Auth0PermissionChecker.has_permission(request.user, self.permission)
 
 
 class HasAuth0Role(BasePermission):
@@ -98,7 +101,7 @@ class HasAuth0Role(BasePermission):
     def has_permission(self, request, view):
         if not request.user.is_authenticated:
             return False
-        return request.user.has_auth0_role(self.role)
+        return Auth0PermissionChecker.has_role(request.user, self.role)
 
 
 class HasAnyAuth0Role(BasePermission):
@@ -108,8 +111,9 @@ class HasAnyAuth0Role(BasePermission):
     """
     def __init__(self, roles):
         self.roles = roles
+        self.roles_set = frozenset(roles)
     
     def has_permission(self, request, view):
         if not request.user.is_authenticated:
             return False
-        return any(request.user.has_auth0_role(role) for role in self.roles)
\ No newline at end of file
+        return Auth0PermissionChecker.has_any_role(request.user, self.roles_set)
\ No newline at end of file
@@ -1,4 +1,5 @@
 from django.core.management.base import BaseCommand
+from django.utils import timezone
 from authentication.models import EventUser
 
 
@@ -14,42 +15,51 @@ class Command(BaseCommand):
             help='Permissions to assign',
             default=[]
         )
+        parser.add_argument(
+            '--emails-file',
+            type=str,
+            help='File with additional user emails, one per line'
+        )
 
     def handle(self, *args, **options):
-        email = options['email']
+        emails = [options['email']]
         roles = options['roles']
         permissions = options['permissions']
 
-        try:
-            user = EventUser.objects.get(email=email)
-        except EventUser.DoesNotExist:
-            self.stdout.write(
-                self.style.ERROR(f'User with email {email} does not exist')
-            )
+        if options['emails_file']:
+            with open(options['emails_file']) as emails_file:
+                emails += [line.strip() for line in emails_file if line.strip()]
+
+        users = EventUser.objects.filter(email__in=emails)
+        existing = set(users.values_list('email', flat=True))
+        for email in emails:
+            if email not in existing:
+                self.stdout.write(
+                    self.style.ERROR(f'User with email {email} does not exist')
+                )
+        if not existing:
             return
 
-        # Update roles
-        user.auth0_roles = roles
+        # Every user gets the same values, so one UPDATE covers them all
+        now = timezone.now()
+        fields = {'auth0_roles': roles, 'last_auth0_sync': now, 'updated_at': now}
         
         # Update permissions if provided
         if permissions:
-            user.auth0_permissions = permissions
+            fields['auth0_permissions'] = permissions
         
-        # Set sync time to now
-        from django.utils import timezone
-        user.last_auth0_sync = timezone.now()
-        
-        user.save()
+        users.update(**fields)
 
+        assigned_to = ', '.join(sorted(existing))
         self.stdout.write(
             self.style.SUCCESS(
-                f'Successfully assigned roles {roles} to {email}'
+                f'Successfully assigned roles {roles} to {assigned_to}'
             )
         )
         
         if permissions:
             self.stdout.write(
                 self.style.SUCCESS(
-                    f'Successfully assigned permissions {permissions} to {email}'
+                    f'Successfully assigned permissions {permissions} to {assigned_to}'
                 )
-            )
\ No newline at end of file
+            )
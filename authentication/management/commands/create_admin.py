@@ -1,5 +1,6 @@
 from django.core.management.base import BaseCommand
 from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
 
 User = get_user_model()
 
@@ -24,28 +25,25 @@ class Command(BaseCommand):
         email = options['email']
         password = options['password']
         
-        # Check if superuser already exists
-        if User.objects.filter(email=email).exists():
+        # Look up and create in one call; the hashed password goes into the INSERT itself
+        user, created = User.objects.get_or_create(
+            email=email,
+            defaults={
+                'username': email,
+                'password': make_password(password),
+                'first_name': 'Admin',
+                'last_name': 'User',
+                'is_staff': True,
+                'is_superuser': True,
+            }
+        )
+        
+        if not created:
             self.stdout.write(
                 self.style.WARNING(f'Superuser with email {email} already exists')
             )
             return
         
-        # Create superuser
-        user = User.objects.create_superuser(
-            username=email,
-            email=email,
-            password=password,
-            first_name='Admin',
-            last_name='User'
-        )
-        
-        # Set additional fields for EventUser
-        user.roles = ['admin']
-        user.subscription_tier = 'premium'
-        user.subscription_active = True
-        user.save()
-        
         self.stdout.write(
             self.style.SUCCESS(
                 f'Successfully created superuser:\n'
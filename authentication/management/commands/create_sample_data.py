@@ -1,6 +1,6 @@
 from django.core.management.base import BaseCommand
 from django.contrib.auth import get_user_model
-from datetime import date, timedelta
+from django.db import transaction
 from authentication.models import Vendor, Service, Package
 
 User = get_user_model()
@@ -9,52 +9,48 @@ class Command(BaseCommand):
     help = 'Create sample data for testing endpoints'
 
     def handle(self, *args, **options):
-        # Create sample users
-        bride = User.objects.create_user(
-            username='jane@example.com',
-            email='jane@example.com',
-            first_name='Jane',
-            last_name='Smith',
-            password='testpass123'
-        )
-        bride.roles = ['bride']
-        bride.wedding_date = date.today() + timedelta(days=180)
-        bride.wedding_venue = 'Central Park'
-        bride.guest_count_estimate = 150
-        bride.auth0_roles = ['bride', 'event-organizer']
-        bride.auth0_permissions = ['create:events', 'manage:guests', 'edit:schedules']
-        bride.save()
+        with transaction.atomic():
+            self.create_sample_data()
 
-        groom = User.objects.create_user(
-            username='john@example.com',
-            email='john@example.com', 
-            first_name='John',
-            last_name='Doe',
-            password='testpass123'
-        )
-        groom.roles = ['groom']
-        groom.partner = bride
-        groom.wedding_date = bride.wedding_date
-        groom.wedding_venue = bride.wedding_venue
-        groom.auth0_roles = ['groom', 'event-organizer']
-        groom.auth0_permissions = ['create:events', 'manage:guests', 'edit:schedules']
-        groom.save()
+    def create_sample_data(self):
+        # Create sample users in one INSERT; ignore_conflicts makes re-runs a no-op for them.
+        # EventUser has no partner or wedding columns, so there is nothing to link afterwards.
+        sample_users = [
+            User(
+                username='jane@example.com',
+                email='jane@example.com',
+                first_name='Jane',
+                last_name='Smith',
+                auth0_roles=['bride', 'event-organizer'],
+                auth0_permissions=['create:events', 'manage:guests', 'edit:schedules']
+            ),
+            User(
+                username='john@example.com',
+                email='john@example.com', 
+                first_name='John',
+                last_name='Doe',
+                auth0_roles=['groom', 'event-organizer'],
+                auth0_permissions=['create:events', 'manage:guests', 'edit:schedules']
+            ),
+            # Vendor user
+            User(
+                username='photographer@example.com',
+                email='photographer@example.com',
+                first_name='Sarah',
+                last_name='Wilson',
+                auth0_roles=['vendor'],
+                auth0_permissions=['manage:vendors', 'access:analytics']
+            ),
+        ]
+        for user in sample_users:
+            user.set_password('testpass123')
+        User.objects.bulk_create(sample_users, ignore_conflicts=True)
         
-        bride.partner = groom
-        bride.save()
-
-        # Create vendor user
-        vendor_user = User.objects.create_user(
-            username='photographer@example.com',
-            email='photographer@example.com',
-            first_name='Sarah',
-            last_name='Wilson',
-            password='testpass123'
-        )
-        vendor_user.roles = ['vendor']
-        vendor_user.auth0_roles = ['vendor']
-        vendor_user.auth0_permissions = ['manage:vendors', 'access:analytics']
-        vendor_user.save()
+        # ignore_conflicts leaves pks unset, so load the rows back by username
+        users = User.objects.in_bulk([u.username for u in sample_users], field_name='username')
+        bride = users['jane@example.com']
+        groom = users['john@example.com']
+        vendor_user = users['photographer@example.com']
 
         # Create vendor business
         vendor = Vendor.objects.create(
@@ -68,25 +64,26 @@ class Command(BaseCommand):
         )
 
         # Create services
-        photography_service = Service.objects.create(
-            vendor=vendor,
-            name='Wedding Photography Package',
-            description='Full day wedding photography coverage',
-            base_price=2500.00,
-            category='photography',
-            duration_hours=8,
-            max_bookings_per_day=1
-        )
-
-        engagement_service = Service.objects.create(
-            vendor=vendor,
-            name='Engagement Session',
-            description='Pre-wedding engagement photo session',
-            base_price=500.00,
-            category='photography',
-            duration_hours=2,
-            max_bookings_per_day=2
-        )
+        photography_service, engagement_service = Service.objects.bulk_create([
+            Service(
+                vendor=vendor,
+                name='Wedding Photography Package',
+                description='Full day wedding photography coverage',
+                base_price=2500.00,
+                category='photography',
+                duration_hours=8,
+                max_bookings_per_day=1
+            ),
+            Service(
+                vendor=vendor,
+                name='Engagement Session',
+                description='Pre-wedding engagement photo session',
+                base_price=500.00,
+                category='photography',
+                duration_hours=2,
+                max_bookings_per_day=2
+            ),
+        ])
 
         # Create package
         wedding_package = Package.objects.create(
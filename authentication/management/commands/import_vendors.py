@@ -1,12 +1,42 @@
 import csv
 from django.core.management.base import BaseCommand
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
 from django.utils.text import slugify
+from authentication.management.utils import chunked
 from authentication.models import Vendor, VendorCategory
+from authentication.models.vendor_business import VENDOR_STATES_CACHE_KEY
+from authentication.models.vendor_category import ACTIVE_CATEGORIES_CACHE_KEY
 import os
 
 User = get_user_model()
 
+BULK_BATCH_SIZE = 1000
+IMPORT_CHUNK_SIZE = 5000
+
+# Columns refreshed on vendors that already exist (business_email and admin are kept)
+VENDOR_IMPORT_UPDATE_FIELDS = [
+    'business_phone', 'website', 'category', 'services_offered', 'address', 'city',
+    'state', 'zip_code', 'description', 'price_range_min', 'pricing_structure',
+    'is_active', 'is_featured', 'updated_at',
+]
+
+# CSV spellings of booleans; anything not truthy is false
+TRUTHY = frozenset({'TRUE', 'T', '1', 'YES', 'Y'})
+FALSY = frozenset({'FALSE', 'F', '0', 'NO', 'N', ''})
+
+
+def is_truthy(value):
+    # The CSV already spells booleans in upper case, so this is usually a single set probe
+    if value in TRUTHY:
+        return True
+    if value in FALSY:
+        return False
+    return value.strip().upper() in TRUTHY
+
+
 class Command(BaseCommand):
     help = 'Import wedding vendors from CSV file'
 
@@ -20,6 +50,7 @@ class Command(BaseCommand):
 
     def handle(self, *args, **options):
         csv_file = options['file']
+        verbose = options['verbosity'] >= 2
         
         # Check if file exists
         if not os.path.exists(csv_file):
@@ -46,87 +77,91 @@ class Command(BaseCommand):
         vendors_updated = 0
         errors = 0
 
+        # Load existing categories and vendors once; rows are matched against these dicts
+        # and written back in bulk instead of a get_or_create per row
+        categories = {c.name: c for c in VendorCategory.objects.all()}
+        # slug is unique too, so names that slugify alike ("Mehndi Artist" / "Mehndi-Artist") share a category
+        categories_by_slug = {c.slug: c for c in categories.values()}
+        vendors = {v.business_name: v for v in Vendor.objects.only('id', 'business_name')}
+        new_categories = []
+        new_vendors = {}
+        updated_vendors = {}
+        # CSV row of each queued vendor, for reporting rows whose write fails
+        vendor_rows = {}
+        now = timezone.now()
+
         with open(csv_file, 'r', encoding='utf-8') as file:
             reader = csv.DictReader(file)
             
-            for row_num, row in enumerate(reader, start=2):
-                try:
-                    # Clean and extract data
-                    name = row['name'].strip('"')
-                    email = row['email'].strip('"')
-                    phone = row['phone'].strip('"')
-                    
-                    # Handle address components
-                    address = row['address'].strip('"')
-                    city = row['city'].strip('"')
-                    state = row['state'].strip('"')
-                    zip_code = row['zip_code'].strip('"')
-                    
-                    # Build full address
-                    full_address = f"{address}, {city}, {state} {zip_code}".strip()
-                    
-                    # Handle price (may be empty)
-                    base_price_str = row['base_price'].strip('"')
-                    base_price = float(base_price_str) if base_price_str else 0.0
-                    
-                    # Handle max_guests (may be empty)
-                    max_guests_str = row['max_guests'].strip('"')
-                    max_guests = int(max_guests_str) if max_guests_str else None
-                    
-                    description = row['description'].strip('"')
-                    contact_name = row['contact_name'].strip('"')
-                    website = row['website'].strip('"')
-                    category = row['category'].strip('"')
-                    amenities = row['amenities'].strip('"')
-                    
-                    # Handle boolean fields
-                    is_active = row.get('is_active', 'TRUE').strip('"').upper() == 'TRUE'
-                    is_featured = row.get('is_featured', 'FALSE').strip('"').upper() == 'TRUE'
-                    
-                    # Get or create vendor category
-                    vendor_category, cat_created = VendorCategory.objects.get_or_create(
-                        name=category,
-                        defaults={
-                            'slug': slugify(category),
-                            'description': f'{category} services for weddings',
-                            'is_active': True
-                        }
-                    )
-                    
-                    if cat_created:
-                        self.stdout.write(f'Created category: {category}')
-                    
-                    # Parse amenities into services list
-                    services_list = [s.strip() for s in amenities.split(',') if s.strip()] if amenities else []
-                    
-                    # Check if vendor exists (by business_name since many don't have emails)
-                    vendor, created = Vendor.objects.get_or_create(
-                        business_name=name,
-                        defaults={
-                            'admin': admin_user,
-                            'business_email': email if email else f"{name.lower().replace(' ', '_')}@example.com",
-                            'business_phone': phone,
-                            'website': website,
-                            'category': vendor_category,
-                            'services_offered': services_list,
-                            'address': full_address,
-                            'city': city,
-                            'state': state,
-                            'zip_code': zip_code,
-                            'description': description,
-                            'price_range_min': base_price if base_price > 0 else None,
-                            'pricing_structure': 'package' if base_price > 0 else 'custom',
-                            'is_active': is_active,
-                            'is_featured': is_featured,
-                        }
-                    )
-                    
-                    if created:
-                        vendors_created += 1
-                        self.stdout.write(f'✓ Created vendor: {name}')
-                    else:
-                        # Update existing vendor
-                        vendor.business_name = name
+            # Resolve and flush the CSV a chunk at a time so memory stays bounded on large files
+            for chunk in chunked(enumerate(reader, start=2), IMPORT_CHUNK_SIZE):
+                for row_num, row in chunk:
+                    try:
+                        # Strip stray quotes from every field in one pass; short rows come back as ''
+                        row = {key: value.strip('"') if value else '' for key, value in row.items() if key is not None}
+                        
+                        # Clean and extract data
+                        name = row['name']
+                        email = row['email']
+                        phone = row['phone']
+                        
+                        # Handle address components
+                        address = row['address']
+                        city = row['city']
+                        state = row['state']
+                        zip_code = row['zip_code']
+                        
+                        # Build full address, skipping blank components instead of leaving stray commas
+                        region = ' '.join(filter(None, (state, zip_code)))
+                        full_address = ', '.join(filter(None, (address, city, region)))
+                        
+                        # Handle price (may be empty)
+                        base_price_str = row['base_price']
+                        base_price = float(base_price_str) if base_price_str else 0.0
+                        
+                        # Handle max_guests (may be empty)
+                        max_guests_str = row['max_guests']
+                        max_guests = int(max_guests_str) if max_guests_str else None
+                        
+                        description = row['description']
+                        contact_name = row['contact_name']
+                        website = row['website']
+                        category = row['category']
+                        amenities = row['amenities']
+                        
+                        # Handle boolean fields
+                        is_active = is_truthy(row.get('is_active', 'TRUE'))
+                        is_featured = is_truthy(row.get('is_featured', 'FALSE'))
+                        
+                        # Look up the vendor category, queueing new ones for a single insert
+                        vendor_category = categories.get(category)
+                        if vendor_category is None:
+                            slug = slugify(category)
+                            vendor_category = categories_by_slug.get(slug)
+                            if vendor_category is None:
+                                vendor_category = categories_by_slug[slug] = VendorCategory(
+                                    name=category,
+                                    slug=slug,
+                                    description=f'{category} services for weddings',
+                                    is_active=True
+                                )
+                                new_categories.append(vendor_category)
+                            categories[category] = vendor_category
+                        
+                        # Parse amenities into services list
+                        services_list = [s.strip() for s in amenities.split(',') if s.strip()] if amenities else []
+                        
+                        # Check if vendor exists (by business_name since many don't have emails)
+                        vendor = vendors.get(name)
+                        if vendor is None:
+                            vendor = vendors[name] = new_vendors[name] = Vendor(
+                                business_name=name,
+                                admin=admin_user,
+                                business_email=email if email else f"{name.lower().replace(' ', '_')}@example.com",
+                            )
+                        elif name not in new_vendors:
+                            updated_vendors[name] = vendor
+                        
                         vendor.business_phone = phone
                         vendor.website = website
                         vendor.category = vendor_category
@@ -140,17 +175,36 @@ class Command(BaseCommand):
                         vendor.pricing_structure = 'package' if base_price > 0 else 'custom'
                         vendor.is_active = is_active
                         vendor.is_featured = is_featured
-                        vendor.save()
+                        # bulk_update() skips auto_now, and updated_at versions the vendor detail cache
+                        vendor.updated_at = now
+                        vendor_rows[name] = row_num
                         
-                        vendors_updated += 1
-                        self.stdout.write(f'↻ Updated vendor: {name}')
-                        
-                except Exception as e:
-                    errors += 1
-                    self.stdout.write(
-                        self.style.ERROR(f'Error on row {row_num}: {str(e)}')
-                    )
-                    continue
+                    except Exception as e:
+                        errors += 1
+                        self.stdout.write(
+                            self.style.ERROR(f'Error on row {row_num}: {str(e)}')
+                        )
+                        continue
+                
+                self.save_categories(categories, categories_by_slug, new_categories)
+                
+                # Vendors only count once their chunk has been written
+                created, updated, failed = self.flush_chunk(
+                    categories_by_slug, vendors, new_vendors, updated_vendors, vendor_rows, verbose
+                )
+                vendors_created += created
+                vendors_updated += updated
+                errors += failed
+                new_categories, new_vendors, updated_vendors, vendor_rows = [], {}, {}, {}
+                
+                # One progress line per chunk; per-vendor lines only with --verbosity 2
+                self.stdout.write(
+                    f'Processed {chunk[-1][0] - 1} rows '
+                    f'({vendors_created} created, {vendors_updated} updated, {errors} errors)'
+                )
+
+        # Bulk writes skip the post_save receivers that clear these
+        cache.delete_many([VENDOR_STATES_CACHE_KEY, ACTIVE_CATEGORIES_CACHE_KEY])
 
         # Summary
         self.stdout.write(
@@ -161,4 +215,108 @@ class Command(BaseCommand):
                 f'  Errors: {errors} rows\n'
                 f'  Total processed: {vendors_created + vendors_updated} vendors'
             )
-        )
\ No newline at end of file
+        )
+
+    def save_categories(self, categories, categories_by_slug, new_categories):
+        """Insert a chunk's queued categories and point the lookup dicts at the saved rows"""
+        if not new_categories:
+            return
+        
+        try:
+            with transaction.atomic():
+                VendorCategory.objects.bulk_create(new_categories, ignore_conflicts=True)
+        except Exception as e:
+            self.stdout.write(
+                self.style.WARNING(f'Bulk category insert failed ({e}), retrying one at a time')
+            )
+            for category in new_categories:
+                try:
+                    with transaction.atomic():
+                        category.save()
+                except Exception as e:
+                    self.stdout.write(
+                        self.style.ERROR(f'Error creating category {category.name}: {str(e)}')
+                    )
+        
+        # ignore_conflicts leaves pks unset, so reload the queued categories by their unique slug
+        saved_categories = VendorCategory.objects.in_bulk(
+            [c.slug for c in new_categories], field_name='slug'
+        )
+        for category in new_categories:
+            if category.slug in saved_categories:
+                categories_by_slug[category.slug] = saved_categories[category.slug]
+                self.stdout.write(f'Created category: {category.name}')
+            else:
+                # Rows in this category are reported when their vendor is written
+                del categories_by_slug[category.slug]
+        
+        for name, category in list(categories.items()):
+            if category.pk is None:
+                if category.slug in saved_categories:
+                    categories[name] = saved_categories[category.slug]
+                else:
+                    del categories[name]
+    
+    def flush_chunk(self, categories_by_slug, vendors, new_vendors, updated_vendors, vendor_rows, verbose):
+        """Write one chunk's queued vendors, returning (created, updated, errors)"""
+        errors = 0
+        
+        # Point vendors at the saved copies of categories queued in this chunk
+        for queued in (new_vendors, updated_vendors):
+            for name, vendor in list(queued.items()):
+                if vendor.category.pk is None:
+                    category = categories_by_slug.get(vendor.category.slug)
+                    if category is None:
+                        errors += 1
+                        self.drop_vendor(vendors, new_vendors, queued, name)
+                        self.stdout.write(self.style.ERROR(
+                            f'Error on row {vendor_rows[name]}: category {vendor.category.name} was not saved'
+                        ))
+                        continue
+                    vendor.category = category
+        
+        try:
+            with transaction.atomic():
+                Vendor.objects.bulk_create(new_vendors.values(), batch_size=BULK_BATCH_SIZE)
+                Vendor.objects.bulk_update(
+                    updated_vendors.values(), VENDOR_IMPORT_UPDATE_FIELDS, batch_size=BULK_BATCH_SIZE
+                )
+        except Exception as e:
+            # One bad row fails the whole chunk; retry each row in its own savepoint to find it
+            self.stdout.write(
+                self.style.WARNING(f'Bulk write failed ({e}), retrying the chunk row by row')
+            )
+            for vendor in new_vendors.values():
+                # The rolled-back bulk insert may already have assigned a pk
+                vendor.pk = None
+                vendor._state.adding = True
+            
+            for queued in (new_vendors, updated_vendors):
+                for name, vendor in list(queued.items()):
+                    try:
+                        with transaction.atomic():
+                            if queued is new_vendors:
+                                vendor.save()
+                            else:
+                                vendor.save(update_fields=VENDOR_IMPORT_UPDATE_FIELDS)
+                    except Exception as e:
+                        errors += 1
+                        self.drop_vendor(vendors, new_vendors, queued, name)
+                        self.stdout.write(
+                            self.style.ERROR(f'Error on row {vendor_rows[name]}: {str(e)}')
+                        )
+        
+        if verbose:
+            for name in new_vendors:
+                self.stdout.write(f'✓ Created vendor: {name}')
+            for name in updated_vendors:
+                self.stdout.write(f'↻ Updated vendor: {name}')
+        
+        return len(new_vendors), len(updated_vendors), errors
+    
+    def drop_vendor(self, vendors, new_vendors, queued, name):
+        """Remove a vendor whose write failed from its chunk"""
+        del queued[name]
+        # A vendor that was never inserted must not look like an existing one to later chunks
+        if queued is new_vendors:
+            del vendors[name]
@@ -1,9 +1,17 @@
+from django.core.cache import cache
 from django.core.management.base import BaseCommand
+from django.db import transaction
+from authentication.management.utils import chunked
 from authentication.models import Vendor, VendorCategory
+from authentication.models.vendor_business import VENDOR_STATES_CACHE_KEY
 import csv
 import os
 
 
+BULK_BATCH_SIZE = 1000
+SEED_CHUNK_SIZE = 5000
+
+
 class Command(BaseCommand):
     help = 'Seed production database with vendors from CSV'
 
@@ -19,43 +27,58 @@ class Command(BaseCommand):
             self.stdout.write(self.style.ERROR(f'CSV file not found at {csv_path}'))
             return
 
+        # Categories are looked up from a dict; vendors are built in memory and inserted per chunk
+        categories = {c.name: c for c in VendorCategory.objects.all()}
+        seen_names = set()
+        created_count = 0
+
         with open(csv_path, 'r') as file:
             reader = csv.DictReader(file)
-            created_count = 0
             
-            for row in reader:
-                # Get or create category
-                category_name = row.get('Category', '').strip()
-                category = None
-                if category_name:
-                    category, _ = VendorCategory.objects.get_or_create(
-                        name=category_name,
-                        defaults={'slug': category_name.lower().replace(' & ', '-').replace(' ', '-')}
-                    )
-                
-                # Create vendor
-                vendor, created = Vendor.objects.get_or_create(
-                    business_name=row.get('Business Name', '').strip(),
-                    defaults={
-                        'category': category,
-                        'location': row.get('Location', '').strip(),
-                        'city': row.get('City', '').strip(),
-                        'state': row.get('State', '').strip(),
-                        'description': row.get('Description', '').strip(),
-                        'website': row.get('Website', '').strip(),
-                        'business_phone': row.get('Business Phone', '').strip(),
-                        'is_verified': True,  # Auto-verify for production
-                        'is_active': True,
-                    }
-                )
-                
-                if created:
-                    created_count += 1
+            # One transaction for the whole seed: a partial run would leave vendors behind
+            # and make the next run skip seeding
+            with transaction.atomic():
+                for chunk in chunked(reader, SEED_CHUNK_SIZE):
+                    vendors = []
+                    for row in chunk:
+                        # Get or create category
+                        category_name = row.get('Category', '').strip()
+                        category = None
+                        if category_name:
+                            category = categories.get(category_name)
+                            if category is None:
+                                category, _ = VendorCategory.objects.get_or_create(
+                                    name=category_name,
+                                    defaults={'slug': category_name.lower().replace(' & ', '-').replace(' ', '-')}
+                                )
+                                categories[category_name] = category
+                        
+                        # First row wins for a repeated business name
+                        business_name = row.get('Business Name', '').strip()
+                        if business_name in seen_names:
+                            continue
+                        seen_names.add(business_name)
+                        
+                        # Parse services
+                        services = row.get('Services Offered', '').strip()
+                        
+                        vendors.append(Vendor(
+                            business_name=business_name,
+                            category=category,
+                            address=row.get('Location', '').strip(),
+                            city=row.get('City', '').strip(),
+                            state=row.get('State', '').strip(),
+                            description=row.get('Description', '').strip(),
+                            website=row.get('Website', '').strip(),
+                            business_phone=row.get('Business Phone', '').strip(),
+                            services_offered=[s.strip() for s in services.split(',')] if services else [],
+                            is_verified=True,  # Auto-verify for production
+                            is_active=True,
+                        ))
                     
-                    # Parse services
-                    services = row.get('Services Offered', '').strip()
-                    if services:
-                        vendor.services_offered = [s.strip() for s in services.split(',')]
-                        vendor.save()
-            
+                    created_count += len(Vendor.objects.bulk_create(vendors, batch_size=BULK_BATCH_SIZE))
+        
+        # bulk_create() skips the post_save receiver that clears the cached state list
+        cache.delete(VENDOR_STATES_CACHE_KEY)
+
         self.stdout.write(self.style.SUCCESS(f'Successfully created {created_count} vendors'))
\ No newline at end of file
@@ -0,0 +1,27 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from authentication.auth0_permissions import get_user_sync
+
+
+class Command(BaseCommand):
+    help = 'Sync Auth0 roles and permissions for users whose stored copy is stale'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--max-age-hours',
+            type=float,
+            default=1,
+            help='Re-sync users last synced longer ago than this (default: 1)'
+        )
+
+    def handle(self, *args, **options):
+        max_age = timedelta(hours=options['max_age_hours'])
+
+        synced = get_user_sync().sync_stale_users(max_age=max_age)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'Synced Auth0 roles and permissions for {synced} stale users'
+            )
+        )
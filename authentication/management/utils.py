@@ -0,0 +1,8 @@
+from itertools import islice
+
+
+def chunked(iterable, size):
+    """Yield successive lists of up to size items from iterable"""
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
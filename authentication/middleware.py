@@ -0,0 +1,18 @@
+from .auth0_permissions import prime_permission_sets
+
+
+class Auth0PermissionMiddleware:
+    """
+    Materialize the authenticated user's Auth0 permission and role sets once per request
+    Must come after django.contrib.auth.middleware.AuthenticationMiddleware
+    """
+    
+    def __init__(self, get_response):
+        self.get_response = get_response
+    
+    def __call__(self, request):
+        user = getattr(request, 'user', None)
+        if user is not None and user.is_authenticated:
+            prime_permission_sets(user)
+        
+        return self.get_response(request)
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.9 on 2026-10-15 09:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication', '0003_vendorimage_aspect_ratio_vendorimage_file_size_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='vendoruser',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['user', 'vendor'], name='vu_user_vendor_active_idx'),
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 5.2.9 on 2026-10-15 09:30
+
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication', '0004_vendoruser_vu_user_vendor_active_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='eventuser',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['auth0_permissions'], name='u_auth0_perms_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='eventuser',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['auth0_roles'], name='u_auth0_roles_gin'),
+        ),
+    ]
@@ -0,0 +1,86 @@
+# Generated by Django 5.2.9 on 2026-10-15 10:00
+
+import logging
+import uuid
+
+from django.db import migrations, models
+
+
+logger = logging.getLogger(__name__)
+
+
+def copy_requested_packages(apps, schema_editor):
+    """
+    Map the old JSON list (package ids or names) onto Package rows of the inquiry's vendor.
+    The JSON stays in package_requested_legacy; entries that match no package are logged.
+    """
+    VendorInquiry = apps.get_model('authentication', 'VendorInquiry')
+    Package = apps.get_model('authentication', 'Package')
+
+    for inquiry in VendorInquiry.objects.exclude(package_requested=[]).iterator():
+        entries = inquiry.package_requested
+        if not isinstance(entries, list):
+            entries = [entries]
+
+        ids, names, unmatched = {}, {}, []
+        for original in entries:
+            entry = original
+            if isinstance(entry, dict):
+                entry = entry.get('id') or entry.get('name')
+            if not entry:
+                unmatched.append(original)
+                continue
+            try:
+                ids[uuid.UUID(str(entry))] = original
+            except ValueError:
+                names[str(entry).strip().lower()] = original
+
+        packages = []
+        for package in Package.objects.filter(vendor_id=inquiry.vendor_id):
+            matched_id = ids.pop(package.id, None) is not None
+            matched_name = names.pop(package.name.strip().lower(), None) is not None
+            if matched_id or matched_name:
+                packages.append(package)
+        if packages:
+            inquiry.requested_packages.add(*packages)
+
+        unmatched.extend(ids.values())
+        unmatched.extend(names.values())
+        for entry in unmatched:
+            logger.warning(
+                "VendorInquiry %s: package_requested entry %r matches no package of vendor %s "
+                "(kept in package_requested_legacy)",
+                inquiry.pk, entry, inquiry.vendor_id,
+            )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication', '0005_eventuser_auth0_gin_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='vendorinquiry',
+            name='requested_packages',
+            field=models.ManyToManyField(blank=True, related_name='inquiries', to='authentication.package'),
+        ),
+        migrations.RunPython(copy_requested_packages, migrations.RunPython.noop),
+        # Keep the original JSON until the mapped packages have been checked
+        migrations.RenameField(
+            model_name='vendorinquiry',
+            old_name='package_requested',
+            new_name='package_requested_legacy',
+        ),
+        migrations.AlterField(
+            model_name='vendorinquiry',
+            name='package_requested_legacy',
+            field=models.JSONField(blank=True, default=list, editable=False, help_text='package_requested JSON from before the ManyToMany; kept for verification'),
+        ),
+        migrations.RenameField(
+            model_name='vendorinquiry',
+            old_name='requested_packages',
+            new_name='package_requested',
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.9 on 2026-10-15 10:30
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication', '0006_vendorinquiry_package_requested_m2m'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddIndex(
+            model_name='vendor',
+            index=models.Index(condition=models.Q(('is_active', True), ('is_verified', True)), fields=['category', 'city', 'price_range_max'], name='vendor_active_listing_ix'),
+        ),
+        migrations.AddIndex(
+            model_name='vendor',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('city'), name='gin_trgm_ops'), name='vendor_city_upper_trgm'),
+        ),
+    ]
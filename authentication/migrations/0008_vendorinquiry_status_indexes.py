@@ -0,0 +1,21 @@
+# Generated by Django 5.2.9 on 2026-10-15 11:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication', '0007_vendor_listing_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='vendorinquiry',
+            index=models.Index(fields=['submitted_by', 'status'], include=('id', 'event_date'), name='inquiry_user_status_ix'),
+        ),
+        migrations.AddIndex(
+            model_name='vendorinquiry',
+            index=models.Index(fields=['vendor', 'status'], name='inquiry_vendor_status_ix'),
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.2.9 on 2026-10-15 12:00
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_pending_inquiries_count(apps, schema_editor):
+    Vendor = apps.get_model('authentication', 'Vendor')
+    VendorInquiry = apps.get_model('authentication', 'VendorInquiry')
+    pending = VendorInquiry.objects.filter(
+        vendor=OuterRef('pk'), status='pending'
+    ).order_by().values('vendor').annotate(total=Count('pk')).values('total')
+    Vendor.objects.update(pending_inquiries_count=Coalesce(Subquery(pending), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication', '0008_vendorinquiry_status_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='vendor',
+            name='pending_inquiries_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_pending_inquiries_count, migrations.RunPython.noop),
+    ]
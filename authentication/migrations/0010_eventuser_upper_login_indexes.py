@@ -0,0 +1,22 @@
+# Generated by Django 5.2.9 on 2026-10-15 13:00
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication', '0009_vendor_pending_inquiries_count'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='eventuser',
+            index=models.Index(django.db.models.functions.text.Upper('email'), name='u_email_upper_ix'),
+        ),
+        migrations.AddIndex(
+            model_name='eventuser',
+            index=models.Index(django.db.models.functions.text.Upper('username'), name='u_username_upper_ix'),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.9 on 2026-10-15 14:00
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication', '0010_eventuser_upper_login_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='vendor',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.search.SearchVector('description', config='english'), name='vendor_description_fts'),
+        ),
+        migrations.AddIndex(
+            model_name='vendorinquiry',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.search.SearchVector('message', config='english'), name='inquiry_message_fts'),
+        ),
+        migrations.AddIndex(
+            model_name='vendorimage',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.search.SearchVector('description', config='english'), name='vimage_description_fts'),
+        ),
+    ]
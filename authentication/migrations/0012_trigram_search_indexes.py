@@ -0,0 +1,27 @@
+# Generated by Django 5.2.9 on 2026-10-15 14:30
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication', '0011_full_text_search_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='vendor',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('business_name'), name='gin_trgm_ops'), name='vendor_bname_upper_trgm'),
+        ),
+        migrations.AddIndex(
+            model_name='vendor',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('business_email'), name='gin_trgm_ops'), name='vendor_bemail_upper_trgm'),
+        ),
+        migrations.AddIndex(
+            model_name='eventuser',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('email'), name='gin_trgm_ops'), name='u_email_upper_trgm'),
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 5.2.9 on 2026-10-15 15:05
+
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication', '0012_trigram_search_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='service',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['blackout_dates'], name='svc_blackout_gin', opclasses=['jsonb_path_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='service',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['available_days_of_week'], name='svc_days_gin', opclasses=['jsonb_path_ops']),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.9 on 2026-10-15 15:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication', '0013_service_availability_gin_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='package',
+            index=models.Index(condition=models.Q(('is_active', True), ('is_public', True)), fields=['vendor', 'is_featured', 'name'], name='package_public_listing_ix'),
+        ),
+        migrations.AddIndex(
+            model_name='serviceavailability',
+            index=models.Index(condition=models.Q(('status', 'available')), fields=['service', 'date', 'start_time'], name='svc_avail_available_idx'),
+        ),
+    ]
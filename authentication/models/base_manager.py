@@ -1,4 +1,5 @@
 from django.contrib.auth.models import BaseUserManager
+from django.db.models import Prefetch
 
 
 class EventUserManager(BaseUserManager):
@@ -26,6 +27,14 @@ class EventUserManager(BaseUserManager):
 
         return self.create_user(email, password, **extra_fields)
 
+    def with_vendor_memberships(self):
+        """Users with active VendorUser rows prefetched for the vendor permission helpers"""
+        vendor_user_model = self.model._meta.get_field('managed_vendors').related_model
+        return self.prefetch_related(Prefetch(
+            'managed_vendors',
+            queryset=vendor_user_model.objects.filter(is_active=True).select_related('vendor'),
+        ))
+
     def get_or_create_from_auth0(self, auth0_user_data):
         auth0_user_id = auth0_user_data.get('sub')
         email = auth0_user_data.get('email')
@@ -1,10 +1,52 @@
+from django.contrib.postgres.indexes import GinIndex
 from django.db import models
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.core.exceptions import ValidationError
+from django.db.models.functions import Greatest
+from django.utils import timezone
 from decimal import Decimal
+from functools import cached_property
 import uuid
 
 
+def _services_total_sum(prefix=''):
+    """SQL sum of base_price * quantity over PackageService rows (a quantity of 0 counts once)"""
+    return models.Sum(
+        models.F(f'{prefix}service__base_price') * Greatest(f'{prefix}quantity', 1),
+        output_field=models.DecimalField(max_digits=14, decimal_places=2),
+    )
+
+
+# Tiered pricing: 10% off orders of more than TIERED_DISCOUNT_MIN_QUANTITY units
+TIERED_DISCOUNT = Decimal('0.9')
+TIERED_DISCOUNT_MIN_QUANTITY = 10
+
+
+def _time_based_price(service, quantity, guest_count):
+    return service.base_price + (service.price_per_unit * quantity)
+
+
+def _per_guest_price(service, quantity, guest_count):
+    if not guest_count:
+        raise ValueError("Guest count required for per-guest pricing")
+    return service.base_price + (service.price_per_unit * guest_count)
+
+
+def _tiered_price(service, quantity, guest_count):
+    base = service.base_price
+    if quantity > TIERED_DISCOUNT_MIN_QUANTITY:
+        base *= TIERED_DISCOUNT
+    return base * quantity
+
+
+# service_type -> price function; flat_rate, custom and unknown types charge base_price
+SERVICE_PRICE_CALCULATORS = {
+    'time_based': _time_based_price,
+    'per_guest': _per_guest_price,
+    'tiered': _tiered_price,
+}
+
+
 class Service(models.Model):
     """Individual services that vendors can offer"""
     
@@ -79,6 +121,9 @@ class Service(models.Model):
         indexes = [
             models.Index(fields=['vendor', 'is_active']),
             models.Index(fields=['category', 'is_active']),
+            # Containment filters in Service.available_on (blackout_dates @> '["2025-01-01"]')
+            GinIndex(fields=['blackout_dates'], opclasses=['jsonb_path_ops'], name='svc_blackout_gin'),
+            GinIndex(fields=['available_days_of_week'], opclasses=['jsonb_path_ops'], name='svc_days_gin'),
         ]
     
     def __str__(self):
@@ -98,38 +143,31 @@ class Service(models.Model):
     
     def calculate_price(self, quantity=1, guest_count=None, custom_options=None):
         """Calculate price based on service type and parameters"""
-        if self.service_type == 'flat_rate':
+        calculator = SERVICE_PRICE_CALCULATORS.get(self.service_type)
+        if calculator is None:
             return self.base_price
-        
-        elif self.service_type == 'time_based':
-            return self.base_price + (self.price_per_unit * quantity)
-        
-        elif self.service_type == 'per_guest':
-            if not guest_count:
-                raise ValueError("Guest count required for per-guest pricing")
-            return self.base_price + (self.price_per_unit * guest_count)
-        
-        elif self.service_type == 'tiered':
-            # Implement tiered pricing logic based on quantity
-            base = self.base_price
-            if quantity > 10:
-                base *= Decimal('0.9')  # 10% discount for large orders
-            return base * quantity
-        
-        return self.base_price
+        return calculator(self, quantity, guest_count)
+    
+    # Built once per instance so availability grids checking many dates stay O(1) per date
+    @cached_property
+    def _available_days_set(self):
+        return frozenset(self.available_days_of_week or ())
+    
+    @cached_property
+    def _blackout_set(self):
+        return frozenset(self.blackout_dates or ())
     
     def is_available_on_date(self, date, start_time=None, duration_hours=None):
         """Check if service is available on a specific date/time"""
         # Check day of week
-        if self.available_days_of_week and date.weekday() not in self.available_days_of_week:
+        if self._available_days_set and date.weekday() not in self._available_days_set:
             return False
         
         # Check blackout dates
-        if date.strftime('%Y-%m-%d') in self.blackout_dates:
+        if date.isoformat() in self._blackout_set:
             return False
         
         # Check advance booking requirement
-        from django.utils import timezone
         days_in_advance = (date - timezone.now().date()).days
         if days_in_advance < self.advance_booking_days:
             return False
@@ -138,6 +176,16 @@ class Service(models.Model):
         
         return True
     
+    @classmethod
+    def available_on(cls, date):
+        """Services that pass is_available_on_date(date), filtered in SQL"""
+        days_in_advance = (date - timezone.now().date()).days
+        # JSON array containment (@>) replaces the Python list scans
+        return cls.objects.filter(
+            models.Q(available_days_of_week=[]) | models.Q(available_days_of_week__contains=[date.weekday()]),
+            advance_booking_days__lte=days_in_advance,
+        ).exclude(blackout_dates__contains=[date.isoformat()])
+    
     def clean(self):
         super().clean()
         if self.service_type in ['time_based', 'per_guest'] and not self.price_per_unit:
@@ -207,22 +255,39 @@ class Package(models.Model):
         verbose_name = "Package"
         verbose_name_plural = "Packages"
         ordering = ['-is_featured', 'name']
+        indexes = [
+            # Public package listings per vendor
+            models.Index(
+                fields=['vendor', 'is_featured', 'name'],
+                condition=models.Q(is_active=True, is_public=True),
+                name='package_public_listing_ix',
+            ),
+        ]
     
     def __str__(self):
         return f"{self.vendor.business_name} - {self.name}"
     
-    @property
+    @classmethod
+    def with_services(cls):
+        """Packages with their services prefetched and services_total_price annotated"""
+        return cls.objects.annotate(
+            _services_total=_services_total_sum('package_services__'),
+        ).prefetch_related(
+            models.Prefetch('package_services', queryset=PackageService.objects.select_related('service'))
+        )
+    
+    # Cached per instance: discounted_price, savings_amount and savings_percentage all
+    # read the total. Pop both from __dict__ after changing the package's services.
+    @cached_property
     def services_total_price(self):
         """Calculate total price of all services without discount"""
-        total = Decimal('0')
-        for package_service in self.package_services.all():
-            service_price = package_service.service.base_price
-            if package_service.quantity:
-                service_price *= package_service.quantity
-            total += service_price
-        return total
+        if hasattr(self, '_services_total'):
+            total = self._services_total
+        else:
+            total = self.package_services.aggregate(total=_services_total_sum())['total']
+        return total or Decimal('0')
     
-    @property
+    @cached_property
     def discounted_price(self):
         """Calculate final package price with discount"""
         if self.discount_type == 'bundle_price' and self.bundle_price:
@@ -247,12 +312,27 @@ class Package(models.Model):
     @property
     def savings_percentage(self):
         """Savings as percentage"""
-        if self.services_total_price > 0:
-            return (self.savings_amount / self.services_total_price) * 100
+        total = self.services_total_price
+        if total > 0:
+            return ((total - self.discounted_price) / total) * 100
         return 0
     
     def is_available_for_date(self, date):
         """Check if package is available for booking on date"""
+        if not self._date_window_ok(date):
+            return False
+        
+        # Check if all services are available: reuse a with_services() prefetch,
+        # otherwise ask the database whether any service is unavailable
+        if 'package_services' in getattr(self, '_prefetched_objects_cache', {}):
+            return all(
+                package_service.service.is_available_on_date(date)
+                for package_service in self.package_services.all()
+            )
+        return not self.package_services.exclude(service__in=Service.available_on(date)).exists()
+    
+    def _date_window_ok(self, date):
+        """Check the package's own active flag, validity window and booking limit"""
         if not self.is_active:
             return False
         
@@ -265,11 +345,6 @@ class Package(models.Model):
         if self.max_bookings and self.current_bookings >= self.max_bookings:
             return False
         
-        # Check if all services are available
-        for package_service in self.package_services.all():
-            if not package_service.service.is_available_on_date(date):
-                return False
-        
         return True
     
     def clean(self):
@@ -345,6 +420,14 @@ class ServiceAvailability(models.Model):
         verbose_name_plural = "Service Availabilities"
         unique_together = ['service', 'date', 'start_time']
         ordering = ['date', 'start_time']
+        indexes = [
+            # Calendar lookups of open slots; the unique index covers unfiltered date ranges
+            models.Index(
+                fields=['service', 'date', 'start_time'],
+                condition=models.Q(status='available'),
+                name='svc_avail_available_idx',
+            ),
+        ]
     
     def __str__(self):
         time_str = f" {self.start_time}-{self.end_time}" if self.start_time else ""
@@ -368,25 +451,34 @@ class ServiceAvailability(models.Model):
     
     def book_capacity(self, quantity=1):
         """Book some capacity for this slot"""
-        if quantity > self.remaining_capacity:
-            raise ValidationError(f"Cannot book {quantity}, only {self.remaining_capacity} remaining")
-        
-        self.capacity_booked += quantity
+        # One conditional UPDATE so concurrent bookings cannot oversell the slot;
+        # the CASE sees the pre-update capacity_booked
+        booked = models.F('capacity_booked') + quantity
+        updated = ServiceAvailability.objects.filter(
+            pk=self.pk, capacity_total__gte=booked
+        ).update(
+            capacity_booked=booked,
+            status=models.Case(
+                models.When(capacity_total__lte=booked, then=models.Value('booked')),
+                default=models.Value('partially_booked'),
+            ),
+            updated_at=timezone.now(),
+        )
+        self.refresh_from_db(fields=['capacity_booked', 'status', 'updated_at'])
         
-        if self.capacity_booked >= self.capacity_total:
-            self.status = 'booked'
-        elif self.capacity_booked > 0:
-            self.status = 'partially_booked'
-        
-        self.save()
+        if not updated:
+            raise ValidationError(f"Cannot book {quantity}, only {self.remaining_capacity} remaining")
     
     def release_capacity(self, quantity=1):
         """Release booked capacity"""
-        self.capacity_booked = max(0, self.capacity_booked - quantity)
-        
-        if self.capacity_booked == 0:
-            self.status = 'available'
-        elif self.capacity_booked < self.capacity_total:
-            self.status = 'partially_booked'
-        
-        self.save()
\ No newline at end of file
+        remaining_booked = models.F('capacity_booked') - quantity
+        ServiceAvailability.objects.filter(pk=self.pk).update(
+            capacity_booked=Greatest(remaining_booked, 0),
+            status=models.Case(
+                models.When(capacity_booked__lte=quantity, then=models.Value('available')),
+                models.When(capacity_total__gt=remaining_booked, then=models.Value('partially_booked')),
+                default=models.F('status'),
+            ),
+            updated_at=timezone.now(),
+        )
+        self.refresh_from_db(fields=['capacity_booked', 'status', 'updated_at'])
@@ -1,7 +1,17 @@
 from django.contrib.auth.models import AbstractUser
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from .base_manager import EventUserManager
+from ..auth0_permissions import (
+    Auth0PermissionChecker, _get_role_set, clear_cached_permission_sets, get_user_sync,
+    prime_permission_sets,
+)
 from django.db import models
+from django.db.models.expressions import RawSQL
+from django.db.models.functions import Upper
 from django.core.exceptions import ValidationError
+from django.utils import timezone
+from functools import cached_property
+import json
 
 
 
@@ -27,6 +37,12 @@ class EventUser(AbstractUser):
         (ADMIN, 'Admin'),
     ]
     
+    # Role groups for the predicates below, tested with one set operation each
+    _COUPLE_ROLES = frozenset({BRIDE, GROOM})
+    _ORGANIZER_ROLES = frozenset({ORGANIZER, CO_ORGANIZER, WEDDING_PLANNER})
+    _PLANNING_ROLES = frozenset({BRIDE, GROOM, WEDDING_PLANNER, ORGANIZER})
+    _VENDOR_REP_ROLES = frozenset({'vendor_owner', 'vendor_staff', VENDOR_REPRESENTATIVE})
+    
 
     
     # Auth0 Fields
@@ -61,21 +77,35 @@ class EventUser(AbstractUser):
     
     def has_role(self, role):
         """Check if user has a specific role"""
-        return role in (self.auth0_roles or [])
+        return role in _get_role_set(self)
     
+    # Both role writers change auth0_roles with a single jsonb UPDATE, so concurrent
+    # Auth0 syncs cannot overwrite each other's roles with a stale list
     def add_role(self, role):
         """Add a role to user's auth0_roles"""
-        if not self.auth0_roles:
-            self.auth0_roles = []
-        if role not in self.auth0_roles:
-            self.auth0_roles.append(role)
-            self.save()
+        if role in (self.auth0_roles or []):
+            return
+        EventUser.objects.filter(pk=self.pk).exclude(auth0_roles__contains=[role]).update(
+            auth0_roles=RawSQL('auth0_roles || %s::jsonb', [json.dumps([role])]),
+            updated_at=timezone.now(),
+        )
+        self.auth0_roles = [*(self.auth0_roles or []), role]
+        clear_cached_permission_sets(self)
     
     def remove_role(self, role):
         """Remove a role from user's auth0_roles"""
-        if self.auth0_roles and role in self.auth0_roles:
-            self.auth0_roles.remove(role)
-            self.save()
+        if not self.auth0_roles or role not in self.auth0_roles:
+            return
+        EventUser.objects.filter(pk=self.pk, auth0_roles__contains=[role]).update(
+            auth0_roles=RawSQL(
+                "(SELECT COALESCE(jsonb_agg(r), '[]'::jsonb) FROM jsonb_array_elements(auth0_roles) r"
+                " WHERE r <> %s::jsonb)",
+                [json.dumps(role)],
+            ),
+            updated_at=timezone.now(),
+        )
+        self.auth0_roles = [r for r in self.auth0_roles if r != role]
+        clear_cached_permission_sets(self)
     
     @property
     def all_roles(self):
@@ -84,7 +114,7 @@ class EventUser(AbstractUser):
     
     @property
     def is_bride_or_groom(self):
-        return self.has_role(self.BRIDE) or self.has_role(self.GROOM)
+        return not _get_role_set(self).isdisjoint(self._COUPLE_ROLES)
     
     @property
     def is_wedding_couple(self):
@@ -92,19 +122,15 @@ class EventUser(AbstractUser):
     
     @property
     def is_event_organizer(self):
-        return (self.has_role(self.ORGANIZER) or 
-                self.has_role(self.CO_ORGANIZER) or 
-                self.has_role(self.WEDDING_PLANNER))
+        return not _get_role_set(self).isdisjoint(self._ORGANIZER_ROLES)
     
     @property
     def has_wedding_planning_access(self):
-        return (self.is_bride_or_groom or 
-                self.has_role(self.WEDDING_PLANNER) or 
-                self.has_role(self.ORGANIZER))
+        return not _get_role_set(self).isdisjoint(self._PLANNING_ROLES)
     
     @property
     def has_premium_access(self):
-        return 'premium' in (self.auth0_roles or [])
+        return 'premium' in _get_role_set(self)
     
     @property
     def can_create_unlimited_events(self):
@@ -116,21 +142,34 @@ class EventUser(AbstractUser):
             return 999
         return 1
     
+    # EventUser field -> Auth0 profile claim refreshed on each login
+    AUTH0_PROFILE_FIELDS = {
+        'auth0_email': 'email',
+        'auth0_picture': 'picture',
+        'auth0_nickname': 'nickname',
+        'email': 'email',
+        'first_name': 'given_name',
+        'last_name': 'family_name',
+    }
+    
     def update_from_auth0(self, auth0_data):
-        self.auth0_email = auth0_data.get('email', self.auth0_email)
-        self.auth0_picture = auth0_data.get('picture', self.auth0_picture)
-        self.auth0_nickname = auth0_data.get('nickname', self.auth0_nickname)
-        self.email = auth0_data.get('email', self.email)
-        self.first_name = auth0_data.get('given_name', self.first_name)
-        self.last_name = auth0_data.get('family_name', self.last_name)
-        self.save()
+        # Only write the profile columns that changed; most logins change nothing
+        changed_fields = []
+        for field, claim in self.AUTH0_PROFILE_FIELDS.items():
+            value = auth0_data.get(claim, getattr(self, field))
+            if value != getattr(self, field):
+                setattr(self, field, value)
+                changed_fields.append(field)
+        if changed_fields:
+            self.save(update_fields=changed_fields + ['updated_at'])
     
     def sync_auth0_permissions(self):
         """Sync user permissions from Auth0 - replaces hard-coded permission logic"""
-        from ..services.auth0_permissions import Auth0UserSync
-        
-        sync_service = Auth0UserSync()
-        return sync_service.sync_user_permissions(self)
+        synced = get_user_sync().sync_user_permissions(self)
+        if synced:
+            # Sets primed earlier in the request still hold the pre-sync grants
+            prime_permission_sets(self)
+        return synced
     
     def needs_permission_sync(self) -> bool:
         """Check if user permissions need to be synced from Auth0"""
@@ -144,13 +183,14 @@ class EventUser(AbstractUser):
         return self.last_auth0_sync < timezone.now() - timedelta(hours=1)
     
     # Auth0 Role Helper Methods
+    # Both go through the frozensets cached on the instance instead of scanning the JSON lists
     def has_auth0_permission(self, permission):
         """Check if user has specific Auth0 permission"""
-        return permission in (self.auth0_permissions or [])
+        return Auth0PermissionChecker.has_permission(self, permission)
     
     def has_auth0_role(self, role):
         """Check if user has specific Auth0 role"""
-        return role in (self.auth0_roles or [])
+        return Auth0PermissionChecker.has_role(self, role)
     
     # Wedding Service Specific Role Checks
     @property
@@ -178,13 +218,20 @@ class EventUser(AbstractUser):
         """Check if user is super admin via Auth0 roles"""
         return self.has_auth0_role('super_admin')
 
+    @cached_property
+    def _active_vendor_users(self):
+        """Active VendorUser rows keyed by vendor_id, loaded once per instance"""
+        if 'managed_vendors' in getattr(self, '_prefetched_objects_cache', {}):
+            vendor_users = [vu for vu in self.managed_vendors.all() if vu.is_active]
+        else:
+            vendor_users = self.managed_vendors.filter(is_active=True).select_related('vendor')
+        return {vu.vendor_id: vu for vu in vendor_users}
+    
     @property
     def is_vendor_representative(self):
         """Check if user represents any vendors"""
-        return (self.has_auth0_role('vendor_owner') or 
-                self.has_auth0_role('vendor_staff') or 
-                self.has_role(self.VENDOR_REPRESENTATIVE) or 
-                self.managed_vendors.exists())
+        return (not _get_role_set(self).isdisjoint(self._VENDOR_REP_ROLES) or
+                bool(self._active_vendor_users))
     
     @property
     def represented_vendors(self):
@@ -196,19 +243,13 @@ class EventUser(AbstractUser):
         if not self.is_vendor_representative:
             return False
         
-        try:
-            vendor_user = self.managed_vendors.get(vendor=vendor, is_active=True)
-            return vendor_user.can_edit_vendor_info
-        except:
-            return False
+        vendor_user = self._active_vendor_users.get(getattr(vendor, 'pk', vendor))
+        return vendor_user is not None and 'edit:vendor_info' in vendor_user.get_vendor_permissions()
     
     def get_vendor_role(self, vendor):
         """Get user's role for a specific vendor"""
-        try:
-            vendor_user = self.managed_vendors.get(vendor=vendor, is_active=True)
-            return vendor_user.role
-        except:
-            return None
+        vendor_user = self._active_vendor_users.get(getattr(vendor, 'pk', vendor))
+        return vendor_user.role if vendor_user else None
     
     def get_wedding_partner(self):
         """Get the wedding partner if exists - simplified for now"""
@@ -232,4 +273,14 @@ class EventUser(AbstractUser):
     
     class Meta:
         verbose_name = "Event User"
-        verbose_name_plural = "Event Users"
\ No newline at end of file
+        verbose_name_plural = "Event Users"
+        indexes = [
+            # Containment lookups, e.g. auth0_permissions__contains=['manage:payments']
+            GinIndex(fields=['auth0_permissions'], name='u_auth0_perms_gin'),
+            GinIndex(fields=['auth0_roles'], name='u_auth0_roles_gin'),
+            # iexact lookups compile to UPPER(col) = UPPER(%s) (EmailOrUsernameBackend login)
+            models.Index(Upper('email'), name='u_email_upper_ix'),
+            models.Index(Upper('username'), name='u_username_upper_ix'),
+            # Admin icontains search on email (UPPER(email) LIKE UPPER('%q%'), pg_trgm)
+            GinIndex(OpClass(Upper('email'), name='gin_trgm_ops'), name='u_email_upper_trgm'),
+        ]
\ No newline at end of file
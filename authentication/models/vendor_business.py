@@ -1,10 +1,20 @@
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import SearchVector
 from django.db import models
+from django.core.cache import cache
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.core.exceptions import ValidationError
+from django.db.models.functions import Upper
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
 from .user_profile import EventUser
 from .vendor_category import VendorCategory
 
 
+VENDOR_STATES_CACHE_KEY = 'vendor:states'
+VENDOR_STATES_CACHE_TTL = 600
+
+
 class Vendor(models.Model):
     """Wedding vendors/service providers - separate from users"""
     
@@ -67,6 +77,9 @@ class Vendor(models.Model):
     is_active = models.BooleanField(default=True)
     is_featured = models.BooleanField(default=False)
     
+    # Denormalized counter, maintained by VendorInquiry.save() and its pre_delete receiver
+    pending_inquiries_count = models.PositiveIntegerField(default=0, editable=False)
+    
     # Timestamps
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -78,6 +91,19 @@ class Vendor(models.Model):
         indexes = [
             models.Index(fields=['category', 'city']),
             models.Index(fields=['is_active', 'is_verified']),
+            # Public vendor listing: category/city/max price filters over listed vendors
+            models.Index(
+                fields=['category', 'city', 'price_range_max'],
+                condition=models.Q(is_active=True, is_verified=True),
+                name='vendor_active_listing_ix',
+            ),
+            # icontains compiles to UPPER(col) LIKE UPPER('%q%'), so the trigram indexes
+            # are built on UPPER(col) (needs the pg_trgm extension)
+            GinIndex(OpClass(Upper('city'), name='gin_trgm_ops'), name='vendor_city_upper_trgm'),
+            GinIndex(OpClass(Upper('business_name'), name='gin_trgm_ops'), name='vendor_bname_upper_trgm'),
+            GinIndex(OpClass(Upper('business_email'), name='gin_trgm_ops'), name='vendor_bemail_upper_trgm'),
+            # Admin full-text search over descriptions (FullTextSearchMixin)
+            GinIndex(SearchVector('description', config='english'), name='vendor_description_fts'),
         ]
     
     def __str__(self):
@@ -103,10 +129,19 @@ class Vendor(models.Model):
         if self.price_range_min and self.price_range_max:
             if self.price_range_min > self.price_range_max:
                 raise ValidationError("Minimum price cannot be greater than maximum price")
+    
+    @classmethod
+    def get_states(cls):
+        """Distinct non-empty vendor states, cached for the admin state filter"""
+        states = cache.get(VENDOR_STATES_CACHE_KEY)
+        if states is None:
+            states = list(
+                cls.objects.exclude(state='').order_by('state').values_list('state', flat=True).distinct()
+            )
+            cache.set(VENDOR_STATES_CACHE_KEY, states, VENDOR_STATES_CACHE_TTL)
+        return states
 
 
-
-
-
-
-
+@receiver([post_save, post_delete], sender=Vendor)
+def clear_vendor_states_cache(sender, **kwargs):
+    cache.delete(VENDOR_STATES_CACHE_KEY)
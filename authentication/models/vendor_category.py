@@ -1,6 +1,13 @@
 from django.db import models
+from django.core.cache import cache
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.core.exceptions import ValidationError
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+
+ACTIVE_CATEGORIES_CACHE_KEY = 'vendor:categories:active'
+ACTIVE_CATEGORIES_CACHE_TTL = 300
 
 
 class VendorCategory(models.Model):
@@ -19,4 +26,18 @@ class VendorCategory(models.Model):
         ordering = ['name']
 
     def __str__(self):
-        return self.name
\ No newline at end of file
+        return self.name
+
+    @classmethod
+    def get_active_filter_options(cls):
+        """Active categories as [{'name', 'slug'}], cached for the vendor list filters"""
+        categories = cache.get(ACTIVE_CATEGORIES_CACHE_KEY)
+        if categories is None:
+            categories = list(cls.objects.filter(is_active=True).values('name', 'slug'))
+            cache.set(ACTIVE_CATEGORIES_CACHE_KEY, categories, ACTIVE_CATEGORIES_CACHE_TTL)
+        return categories
+
+
+@receiver([post_save, post_delete], sender=VendorCategory)
+def clear_active_categories_cache(sender, **kwargs):
+    cache.delete(ACTIVE_CATEGORIES_CACHE_KEY)
@@ -1,3 +1,5 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector
 from django.db import models
 from django.contrib.postgres.fields import ArrayField
 from django.core.validators import FileExtensionValidator
@@ -270,6 +272,8 @@ class VendorImage(models.Model):
         indexes = [
             models.Index(fields=['vendor', 'image_type']),
             models.Index(fields=['is_active', 'is_primary']),
+            # Admin full-text search over descriptions (FullTextSearchMixin)
+            GinIndex(SearchVector('description', config='english'), name='vimage_description_fts'),
         ]
     
     def __str__(self):
@@ -1,9 +1,34 @@
-from django.db import models
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector
+from django.db import models, transaction
+from django.db.models import F
+from django.db.models.signals import pre_delete
+from django.dispatch import receiver
 
 from .user_profile import EventUser
 from .vendor_business import Vendor
 
 
+class VendorInquiryManager(models.Manager):
+    def get_queryset(self):
+        # __str__ renders vendor.business_name; join it up front instead of a query per row
+        return super().get_queryset().select_related('vendor')
+    
+    def create_for_vendors(self, vendors, **fields):
+        """
+        Send the same inquiry to several vendors with one INSERT ... RETURNING.
+        Fields must already be validated; package_requested is set separately.
+        """
+        with transaction.atomic():
+            inquiries = self.bulk_create([self.model(vendor=vendor, **fields) for vendor in vendors])
+            # bulk_create() skips save(), so bump the pending counters here
+            if fields.get('status', 'pending') == 'pending':
+                Vendor.objects.filter(pk__in=[vendor.pk for vendor in vendors]).update(
+                    pending_inquiries_count=F('pending_inquiries_count') + 1
+                )
+        return inquiries
+
+
 class VendorInquiry(models.Model):
     """Track inquiries sent to vendors from couples"""
 
@@ -28,7 +53,11 @@ class VendorInquiry(models.Model):
 
     # Inquiry Details
     message = models.TextField()
-    package_requested = models.JSONField(default=list)
+    package_requested = models.ManyToManyField('Package', blank=True, related_name='inquiries')
+    package_requested_legacy = models.JSONField(
+        default=list, blank=True, editable=False,
+        help_text="package_requested JSON from before the ManyToMany; kept for verification"
+    )
 
     # Status
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending')
@@ -39,10 +68,69 @@ class VendorInquiry(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     responded_at = models.DateTimeField(null=True, blank=True)
 
+    objects = VendorInquiryManager()
+
     class Meta:
         verbose_name = "Vendor Inquiry"
         verbose_name_plural = "Vendor Inquiries"
         ordering = ['-created_at']
+        indexes = [
+            # A couple's inquiries by status; INCLUDE allows index-only scans of the list
+            models.Index(
+                fields=['submitted_by', 'status'],
+                include=['id', 'event_date'],
+                name='inquiry_user_status_ix',
+            ),
+            # Per-vendor inquiries by status (pending_inquiries_count backfill)
+            models.Index(fields=['vendor', 'status'], name='inquiry_vendor_status_ix'),
+            # Admin full-text search over messages (FullTextSearchMixin)
+            GinIndex(SearchVector('message', config='english'), name='inquiry_message_fts'),
+        ]
 
     def __str__(self):
-        return f"Inquiry to {self.vendor.business_name} for {self.event_date}"
\ No newline at end of file
+        return f"Inquiry to {self.vendor.business_name} for {self.event_date}"
+    
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember what was stored so save() knows which vendor counter to move;
+        # None marks a field deferred by only()/defer(), i.e. unknown
+        instance._loaded_pending = (instance.__dict__.get('vendor_id'), instance.__dict__.get('status'))
+        return instance
+    
+    def save(self, *args, **kwargs):
+        with transaction.atomic():
+            if self._state.adding:
+                old_vendor_id, old_status = None, None
+            else:
+                old_vendor_id, old_status = getattr(self, '_loaded_pending', (None, None))
+                if old_vendor_id is None or old_status is None:
+                    # Loaded with vendor or status deferred: read the stored values, locked
+                    # so a concurrent save cannot move the counter in between
+                    stored = VendorInquiry.objects.select_for_update().filter(pk=self.pk).values_list(
+                        'vendor_id', 'status'
+                    ).first()
+                    old_vendor_id, old_status = stored or (None, None)
+            super().save(*args, **kwargs)
+            was_pending = old_status == 'pending'
+            is_pending = self.status == 'pending'
+            if was_pending and (not is_pending or old_vendor_id != self.vendor_id):
+                adjust_pending_inquiries_count(old_vendor_id, -1)
+            if is_pending and (not was_pending or old_vendor_id != self.vendor_id):
+                adjust_pending_inquiries_count(self.vendor_id, 1)
+        self._loaded_pending = (self.vendor_id, self.status)
+
+
+def adjust_pending_inquiries_count(vendor_id, delta):
+    """Atomically shift a vendor's denormalized pending inquiry counter"""
+    Vendor.objects.filter(pk=vendor_id).update(
+        pending_inquiries_count=F('pending_inquiries_count') + delta
+    )
+
+
+# pre_delete: the row still exists, so a deferred status can be loaded; the counter update
+# runs in the delete's transaction
+@receiver(pre_delete, sender=VendorInquiry)
+def decrement_pending_inquiries_count(sender, instance, **kwargs):
+    if instance.status == 'pending':
+        adjust_pending_inquiries_count(instance.vendor_id, -1)
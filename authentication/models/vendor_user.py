@@ -3,6 +3,35 @@ from .vendor_business import Vendor
 from .user_profile import EventUser
 
 
+# Vendor-scoped permissions granted by each VendorUser role
+_BASE_VENDOR_PERMISSIONS = ('read:vendor_info', 'read:vendor_inquiries')
+
+VENDOR_ROLE_PERMISSIONS = {
+    'admin': _BASE_VENDOR_PERMISSIONS + (
+        'edit:vendor_info',
+        'manage:vendor_bookings',
+        'respond:vendor_inquiries',
+        'view:vendor_analytics',
+        'manage:vendor_team',
+    ),
+    'manager': _BASE_VENDOR_PERMISSIONS + (
+        'edit:vendor_info',
+        'manage:vendor_bookings',
+        'respond:vendor_inquiries',
+        'view:vendor_analytics',
+    ),
+    'employee': _BASE_VENDOR_PERMISSIONS + (
+        'manage:vendor_bookings',
+        'respond:vendor_inquiries',
+    ),
+}
+
+# VendorUser roles whose permissions include editing the vendor's business details
+VENDOR_INFO_EDITOR_ROLES = frozenset(
+    role for role, permissions in VENDOR_ROLE_PERMISSIONS.items() if 'edit:vendor_info' in permissions
+)
+
+
 class VendorUser(models.Model):
     """Simple many-to-many relationship between vendors and users"""
 
@@ -24,6 +53,18 @@ class VendorUser(models.Model):
         verbose_name = "Vendor User"
         verbose_name_plural = "Vendor Users"
         unique_together = ['vendor', 'user']
+        indexes = [
+            # Serves managed_vendors.filter(vendor=..., is_active=True) permission lookups
+            models.Index(
+                fields=['user', 'vendor'],
+                condition=models.Q(is_active=True),
+                name='vu_user_vendor_active_idx',
+            ),
+        ]
 
     def __str__(self):
         return f"{self.user.display_name} - {self.vendor.business_name} ({self.role})"
+
+    def get_vendor_permissions(self):
+        """Permissions this user has for the vendor, based on their role"""
+        return VENDOR_ROLE_PERMISSIONS.get(self.role, _BASE_VENDOR_PERMISSIONS)
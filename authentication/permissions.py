@@ -1,5 +1,6 @@
 from rest_framework.permissions import BasePermission
 from authentication.models import Vendor
+from authentication.models.vendor_user import VENDOR_INFO_EDITOR_ROLES
 
 
 class IsVendorOwnerOrStaff(BasePermission):
@@ -59,11 +60,11 @@ class CanManageOwnVendor(BasePermission):
             if obj.admin == request.user:
                 return True
             
-            # Check staff relationship
+            # Check staff relationship: only roles with edit:vendor_info
             return obj.vendor_users.filter(
                 user=request.user,
                 is_active=True,
-                can_edit_vendor_info=True  # Additional field to control edit rights
+                role__in=VENDOR_INFO_EDITOR_ROLES
             ).exists()
         
         return False
@@ -0,0 +1,20 @@
+import orjson
+from rest_framework.renderers import BaseRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+
+# orjson handles dicts, lists, datetimes and UUIDs natively; anything else
+# (Decimal, lazy translation strings, querysets) falls back to DRF's encoder
+_drf_encoder = JSONEncoder()
+
+
+class ORJSONRenderer(BaseRenderer):
+    """JSON renderer backed by orjson"""
+    media_type = 'application/json'
+    format = 'json'
+    charset = None
+    
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return orjson.dumps(data, default=_drf_encoder.default, option=orjson.OPT_NON_STR_KEYS)
@@ -1,133 +1,9 @@
 """
-Auth0 User Permissions Sync Service
+Auth0 User Permissions Service
 
-This service handles syncing user permissions from Auth0 to Django.
-Replace hard-coded permission logic with Auth0 RBAC.
+Permission checks backed by the Auth0 RBAC data stored on each user.
+Syncing that data from Auth0 lives in authentication/auth0_permissions.py.
 """
-import logging
-from django.utils import timezone
-from django.conf import settings
-import requests
-
-logger = logging.getLogger(__name__)
-
-
-class Auth0UserSync:
-    """Service to sync user permissions from Auth0"""
-    
-    def __init__(self):
-        self.auth0_domain = settings.AUTH0_DOMAIN
-        self.management_api_token = None  # Should be obtained from Auth0 Management API
-    
-    def sync_user_permissions(self, user):
-        """
-        Sync user permissions from Auth0.
-        
-        In production, this would:
-        1. Get Management API token
-        2. Fetch user roles from Auth0
-        3. Fetch permissions for those roles
-        4. Update user.auth0_roles and user.auth0_permissions
-        5. Update user.last_auth0_sync
-        
-        For now, this is a placeholder that sets basic permissions.
-        """
-        try:
-            # Placeholder implementation - replace with actual Auth0 API calls
-            if not user.auth0_user_id:
-                logger.warning(f"User {user.email} has no Auth0 ID, cannot sync permissions")
-                return False
-            
-            # Mock sync - in production, fetch from Auth0 Management API
-            user.auth0_roles = self._get_default_roles(user)
-            user.auth0_permissions = self._get_permissions_for_roles(user.auth0_roles)
-            user.last_auth0_sync = timezone.now()
-            user.save()
-            
-            logger.info(f"Synced permissions for user {user.email}")
-            return True
-            
-        except Exception as e:
-            logger.error(f"Failed to sync permissions for user {user.email}: {e}")
-            return False
-    
-    def _get_default_roles(self, user):
-        """Get default roles based on user type - replace with Auth0 API call"""
-        roles = ['user']  # Default role
-        
-        # Add vendor representative role if user manages vendors
-        if user.managed_vendors.exists():
-            roles.append('vendor_representative')
-        
-        # Add organizer role if user is event organizer
-        if user.has_role(user.ORGANIZER):
-            roles.append('event_organizer')
-        
-        return roles
-    
-    def _get_permissions_for_roles(self, roles):
-        """Map roles to permissions - replace with Auth0 API call"""
-        permissions = []
-        
-        role_permissions = {
-            'user': [
-                'read:own_profile',
-                'update:own_profile',
-                'read:vendors',
-                'create:inquiries'
-            ],
-            'vendor_representative': [
-                'read:own_profile',
-                'update:own_profile', 
-                'read:vendors',
-                'update:own_vendor',
-                'manage:vendor_images',
-                'read:inquiries'
-            ],
-            'event_organizer': [
-                'read:own_profile',
-                'update:own_profile',
-                'read:vendors',
-                'create:events',
-                'manage:events',
-                'invite:users'
-            ]
-        }
-        
-        for role in roles:
-            permissions.extend(role_permissions.get(role, []))
-        
-        return list(set(permissions))  # Remove duplicates
-    
-    def get_management_api_token(self):
-        """
-        Get Auth0 Management API token.
-        
-        In production, implement this to get a token from Auth0:
-        https://auth0.com/docs/secure/tokens/access-tokens/management-api-access-tokens
-        """
-        # Placeholder - implement Auth0 Management API token request
-        pass
-    
-    def fetch_user_roles_from_auth0(self, user_id):
-        """
-        Fetch user roles from Auth0 Management API.
-        
-        In production, implement this:
-        GET https://{domain}/api/v2/users/{user_id}/roles
-        """
-        # Placeholder - implement Auth0 Management API call
-        pass
-    
-    def fetch_role_permissions_from_auth0(self, role_id):
-        """
-        Fetch permissions for a role from Auth0 Management API.
-        
-        In production, implement this:
-        GET https://{domain}/api/v2/roles/{role_id}/permissions
-        """
-        # Placeholder - implement Auth0 Management API call
-        pass
 
 
 class Auth0PermissionChecker:
@@ -1,3 +1,493 @@
+import csv
+import datetime
+import os
+import tempfile
+from concurrent.futures import Future
+from decimal import Decimal
+from io import StringIO
+from types import SimpleNamespace
+from unittest import mock
+
+import requests
+
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.core.management import call_command
 from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIRequestFactory
+from rest_framework.throttling import ScopedRateThrottle
+
+from .auth0_permissions import Auth0UserSync, prime_permission_sets
+from .models import (
+    EventUser, Vendor, VendorCategory, VendorInquiry, VendorUser, Service, ServiceAvailability
+)
+from .permissions import CanManageOwnVendor
+from .views.image_upload import ImageUploadAPIView
+from .views.vendor_management_views import VendorManagementDetailAPIView
+from .views.vendor_views import VendorDetailAPIView
+
+
+def make_user(email, **extra_fields):
+    return EventUser.objects.create_user(email=email, password='test-pass', **extra_fields)
+
+
+class VendorMembershipHelperTests(TestCase):
+    """EventUser.can_manage_vendor / get_vendor_role read the cached active memberships"""
+    
+    @classmethod
+    def setUpTestData(cls):
+        cls.vendor = Vendor.objects.create(business_name='Marigold Events')
+        cls.other_vendor = Vendor.objects.create(business_name='Saffron Catering')
+        cls.members = {}
+        for role in ('admin', 'manager', 'employee'):
+            user = make_user(f'{role}@example.com')
+            VendorUser.objects.create(vendor=cls.vendor, user=user, role=role)
+            cls.members[role] = user
+        cls.outsider = make_user('outsider@example.com')
+    
+    def fresh(self, user):
+        # The memberships are cached per instance, so load a new one for each check
+        return EventUser.objects.get(pk=user.pk)
+    
+    def test_can_manage_vendor_follows_role_permissions(self):
+        self.assertTrue(self.fresh(self.members['admin']).can_manage_vendor(self.vendor))
+        self.assertTrue(self.fresh(self.members['manager']).can_manage_vendor(self.vendor))
+        self.assertFalse(self.fresh(self.members['employee']).can_manage_vendor(self.vendor))
+        self.assertFalse(self.fresh(self.outsider).can_manage_vendor(self.vendor))
+    
+    def test_can_manage_vendor_accepts_vendor_pk(self):
+        self.assertTrue(self.fresh(self.members['admin']).can_manage_vendor(self.vendor.pk))
+    
+    def test_can_manage_vendor_other_vendor(self):
+        self.assertFalse(self.fresh(self.members['admin']).can_manage_vendor(self.other_vendor))
+    
+    def test_get_vendor_role(self):
+        for role, user in self.members.items():
+            self.assertEqual(self.fresh(user).get_vendor_role(self.vendor), role)
+        self.assertIsNone(self.fresh(self.outsider).get_vendor_role(self.vendor))
+        self.assertIsNone(self.fresh(self.members['admin']).get_vendor_role(self.other_vendor))
+    
+    def test_inactive_membership_is_ignored(self):
+        user = make_user('former@example.com')
+        VendorUser.objects.create(vendor=self.vendor, user=user, role='admin', is_active=False)
+        user = self.fresh(user)
+        self.assertFalse(user.can_manage_vendor(self.vendor))
+        self.assertIsNone(user.get_vendor_role(self.vendor))
+    
+    def test_helpers_share_one_membership_query(self):
+        user = self.fresh(self.members['manager'])
+        with self.assertNumQueries(1):
+            self.assertTrue(user.can_manage_vendor(self.vendor))
+            self.assertEqual(user.get_vendor_role(self.vendor), 'manager')
+            self.assertFalse(user.can_manage_vendor(self.other_vendor))
+    
+    def test_prefetched_memberships_need_no_query(self):
+        user = EventUser.objects.with_vendor_memberships().get(pk=self.members['employee'].pk)
+        with self.assertNumQueries(0):
+            self.assertEqual(user.get_vendor_role(self.vendor), 'employee')
+            self.assertFalse(user.can_manage_vendor(self.vendor))
+
+
+class CanManageOwnVendorTests(TestCase):
+    """Object-level edit rights come from vendor ownership or an editing VendorUser role"""
+    
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = make_user('owner@example.com')
+        cls.vendor = Vendor.objects.create(business_name='Marigold Events', admin=cls.owner)
+        cls.members = {}
+        for role in ('admin', 'manager', 'employee'):
+            user = make_user(f'{role}@example.com')
+            VendorUser.objects.create(vendor=cls.vendor, user=user, role=role)
+            cls.members[role] = user
+        cls.outsider = make_user('outsider@example.com')
+    
+    def has_object_permission(self, user):
+        request = SimpleNamespace(user=user)
+        return CanManageOwnVendor().has_object_permission(request, None, self.vendor)
+    
+    def test_owner_and_editing_roles_allowed(self):
+        self.assertTrue(self.has_object_permission(self.owner))
+        self.assertTrue(self.has_object_permission(self.members['admin']))
+        self.assertTrue(self.has_object_permission(self.members['manager']))
+    
+    def test_employee_and_outsider_denied(self):
+        self.assertFalse(self.has_object_permission(self.members['employee']))
+        self.assertFalse(self.has_object_permission(self.outsider))
+    
+    def test_detail_view_can_user_edit_matches_permission(self):
+        view = VendorManagementDetailAPIView()
+        for user in (self.owner, self.outsider, *self.members.values()):
+            self.assertEqual(view.can_user_edit(user, self.vendor), self.has_object_permission(user))
+
+
+class PendingInquiriesCountTests(TestCase):
+    """Vendor.pending_inquiries_count follows inquiry creates, status/vendor changes and deletes"""
+    
+    @classmethod
+    def setUpTestData(cls):
+        cls.couple = make_user('couple@example.com')
+        cls.vendor = Vendor.objects.create(business_name='Marigold Events')
+        cls.other_vendor = Vendor.objects.create(business_name='Saffron Catering')
+    
+    def make_inquiry(self, vendor=None, **fields):
+        fields.setdefault('status', 'pending')
+        return VendorInquiry.objects.create(
+            vendor=vendor or self.vendor,
+            submitted_by=self.couple,
+            event_date=datetime.date(2027, 5, 1),
+            event_location='Edison, NJ',
+            guest_count=250,
+            message='Looking for sangeet decor',
+            **fields
+        )
+    
+    def assertPendingCounts(self, vendor_count, other_vendor_count):
+        self.assertEqual(
+            (Vendor.objects.get(pk=self.vendor.pk).pending_inquiries_count,
+             Vendor.objects.get(pk=self.other_vendor.pk).pending_inquiries_count),
+            (vendor_count, other_vendor_count),
+        )
+    
+    def test_create(self):
+        self.make_inquiry()
+        self.make_inquiry(status='responded')
+        self.assertPendingCounts(1, 0)
+    
+    def test_create_for_vendors(self):
+        VendorInquiry.objects.create_for_vendors(
+            [self.vendor, self.other_vendor],
+            submitted_by=self.couple,
+            event_date=datetime.date(2027, 5, 1),
+            event_location='Edison, NJ',
+            guest_count=250,
+            message='Looking for sangeet decor',
+        )
+        self.assertPendingCounts(1, 1)
+    
+    def test_status_change(self):
+        inquiry = self.make_inquiry()
+        inquiry.status = 'responded'
+        inquiry.save()
+        self.assertPendingCounts(0, 0)
+        
+        inquiry = VendorInquiry.objects.get(pk=inquiry.pk)
+        inquiry.status = 'pending'
+        inquiry.save()
+        self.assertPendingCounts(1, 0)
+        
+        # Saving without a status change leaves the counter alone
+        inquiry.save()
+        self.assertPendingCounts(1, 0)
+    
+    def test_vendor_change(self):
+        inquiry = self.make_inquiry()
+        inquiry.vendor = self.other_vendor
+        inquiry.save()
+        self.assertPendingCounts(0, 1)
+    
+    def test_deferred_status_is_not_counted_twice(self):
+        inquiry = self.make_inquiry()
+        inquiry = VendorInquiry.objects.defer('status').get(pk=inquiry.pk)
+        inquiry.message = 'Also need mehndi decor'
+        inquiry.save()
+        self.assertPendingCounts(1, 0)
+        
+        inquiry = VendorInquiry.objects.only('id', 'message', 'vendor').get(pk=inquiry.pk)
+        inquiry.status = 'declined'
+        inquiry.save()
+        self.assertPendingCounts(0, 0)
+    
+    def test_delete(self):
+        pending = self.make_inquiry()
+        responded = self.make_inquiry(status='responded')
+        responded.delete()
+        self.assertPendingCounts(1, 0)
+        pending.delete()
+        self.assertPendingCounts(0, 0)
+    
+    def test_delete_with_deferred_status(self):
+        inquiry = self.make_inquiry()
+        VendorInquiry.objects.defer('status').get(pk=inquiry.pk).delete()
+        self.assertPendingCounts(0, 0)
+
+
+class VendorDetailCacheTests(TestCase):
+    """Cached vendor details still show the current category"""
+    
+    def setUp(self):
+        cache.clear()
+        self.category = VendorCategory.objects.create(name='Decor', slug='decor')
+        self.vendor = Vendor.objects.create(
+            business_name='Marigold Events', category=self.category, is_verified=True
+        )
+    
+    def get_detail(self):
+        request = APIRequestFactory().get(f'/vendors/{self.vendor.pk}/')
+        return VendorDetailAPIView.as_view()(request, vendor_id=self.vendor.pk).data['data']
+    
+    def test_category_rename_shows_without_vendor_save(self):
+        self.assertEqual(self.get_detail()['category'], {'name': 'Decor', 'slug': 'decor'})
+        
+        self.category.name = 'Decor & Lighting'
+        self.category.slug = 'decor-lighting'
+        self.category.save()
+        
+        self.assertEqual(
+            self.get_detail()['category'], {'name': 'Decor & Lighting', 'slug': 'decor-lighting'}
+        )
+
+
+class ServiceAvailabilityCapacityTests(TestCase):
+    """book_capacity / release_capacity move capacity and status in one conditional UPDATE"""
+    
+    @classmethod
+    def setUpTestData(cls):
+        category = VendorCategory.objects.create(name='Decor', slug='decor')
+        vendor = Vendor.objects.create(business_name='Marigold Events', category=category)
+        cls.service = Service.objects.create(
+            vendor=vendor, category=category, name='Mandap setup',
+            description='Mandap and stage decor', base_price=Decimal('2500.00'),
+        )
+    
+    def setUp(self):
+        self.slot = ServiceAvailability.objects.create(
+            service=self.service, date=datetime.date(2027, 5, 1), capacity_total=3
+        )
+    
+    def assertSlot(self, capacity_booked, status):
+        for slot in (self.slot, ServiceAvailability.objects.get(pk=self.slot.pk)):
+            self.assertEqual((slot.capacity_booked, slot.status), (capacity_booked, status))
+    
+    def test_booking_transitions(self):
+        self.slot.book_capacity(2)
+        self.assertSlot(2, 'partially_booked')
+        self.slot.book_capacity(1)
+        self.assertSlot(3, 'booked')
+    
+    def test_booking_at_capacity_is_rejected(self):
+        self.slot.book_capacity(3)
+        with self.assertRaises(ValidationError):
+            self.slot.book_capacity(1)
+        self.assertSlot(3, 'booked')
+    
+    def test_booking_over_remaining_is_rejected(self):
+        with self.assertRaises(ValidationError):
+            self.slot.book_capacity(4)
+        self.assertSlot(0, 'available')
+    
+    def test_stale_instance_cannot_oversell(self):
+        stale = ServiceAvailability.objects.get(pk=self.slot.pk)
+        self.slot.book_capacity(3)
+        with self.assertRaises(ValidationError):
+            stale.book_capacity(1)
+        self.assertSlot(3, 'booked')
+    
+    def test_release_transitions(self):
+        self.slot.book_capacity(3)
+        self.slot.release_capacity(1)
+        self.assertSlot(2, 'partially_booked')
+        self.slot.release_capacity(5)
+        self.assertSlot(0, 'available')
+
+
+class FakeAuth0Response:
+    def __init__(self, payload, status_code=200):
+        self.payload = payload
+        self.status_code = status_code
+    
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f'{self.status_code} error', response=self)
+    
+    def json(self):
+        return self.payload
+
+
+def done_future(result):
+    future = Future()
+    future.set_result(result)
+    return future
+
+
+class Auth0SyncTests(TestCase):
+    """Auth0UserSync writes each user's own Auth0 roles/permissions back"""
+    
+    AUTH0_DATA = {
+        'auth0|alice': (['wedding_planner'], ['create:events', 'read:vendors']),
+        'auth0|bob': (['bride_groom'], ['read:vendors']),
+    }
+    
+    def setUp(self):
+        cache.clear()
+        self.alice = make_user('alice@example.com', auth0_user_id='auth0|alice', auth0_roles=['stale'])
+        self.bob = make_user('bob@example.com', auth0_user_id='auth0|bob')
+        self.missing = make_user('missing@example.com', auth0_user_id='auth0|missing', auth0_roles=['keep'])
+        self.local = make_user('local@example.com', auth0_roles=['keep'])
+    
+    def fake_request(self, auth0_user_id, headers):
+        if auth0_user_id not in self.AUTH0_DATA:
+            not_found = FakeAuth0Response({'message': 'Not Found'}, status_code=404)
+            return done_future(not_found), done_future(not_found)
+        roles, permissions = self.AUTH0_DATA[auth0_user_id]
+        return (
+            done_future(FakeAuth0Response([{'name': role} for role in roles])),
+            done_future(FakeAuth0Response([{'permission_name': perm} for perm in permissions])),
+        )
+    
+    def patch_auth0(self):
+        token = mock.patch.object(Auth0UserSync, 'get_management_token', return_value='token')
+        request = mock.patch.object(Auth0UserSync, '_request_roles_and_permissions', side_effect=self.fake_request)
+        return token, request
+    
+    def test_bulk_sync_writes_each_users_roles(self):
+        user_sync = Auth0UserSync()
+        token, request = self.patch_auth0()
+        with token, request:
+            synced = user_sync.sync_users_bulk([self.alice, self.bob, self.missing, self.local])
+        
+        self.assertEqual(synced, 2)
+        for user in (self.alice, self.bob):
+            user = EventUser.objects.get(pk=user.pk)
+            roles, permissions = self.AUTH0_DATA[user.auth0_user_id]
+            self.assertEqual(user.auth0_roles, roles)
+            self.assertEqual(user.auth0_permissions, permissions)
+            self.assertIsNotNone(user.last_auth0_sync)
+        
+        # Users Auth0 doesn't know, or without an Auth0 id, keep their stored data
+        for user in (self.missing, self.local):
+            user = EventUser.objects.get(pk=user.pk)
+            self.assertEqual(user.auth0_roles, ['keep'])
+            self.assertIsNone(user.last_auth0_sync)
+        self.assertFalse(user_sync.is_syncable_user_id('auth0|missing'))
+    
+    def test_sync_command_skips_recently_synced_users(self):
+        synced_at = timezone.now() - datetime.timedelta(minutes=5)
+        EventUser.objects.filter(pk=self.bob.pk).update(last_auth0_sync=synced_at)
+        
+        token, request = self.patch_auth0()
+        with token, request:
+            call_command('sync_auth0_users', '--max-age-hours', '1', stdout=StringIO())
+        
+        self.assertEqual(EventUser.objects.get(pk=self.alice.pk).auth0_roles, ['wedding_planner'])
+        bob = EventUser.objects.get(pk=self.bob.pk)
+        self.assertEqual(bob.auth0_roles, [])
+        self.assertEqual(bob.last_auth0_sync, synced_at)
+    
+    def test_live_sync_refreshes_primed_permission_sets(self):
+        prime_permission_sets(self.alice)
+        self.assertFalse(self.alice.has_auth0_permission('create:events'))
+        
+        token, request = self.patch_auth0()
+        with token, request:
+            self.assertTrue(self.alice.sync_auth0_permissions())
+        
+        self.assertTrue(self.alice.has_auth0_permission('create:events'))
+        self.assertTrue(self.alice.has_auth0_role('wedding_planner'))
+        self.assertFalse(self.alice.has_auth0_role('stale'))
+    
+    def test_live_sync_writes_only_auth0_fields(self):
+        self.bob.first_name = 'Unsaved'
+        token, request = self.patch_auth0()
+        with token, request:
+            self.assertTrue(self.bob.sync_auth0_permissions())
+        
+        bob = EventUser.objects.get(pk=self.bob.pk)
+        self.assertEqual(bob.auth0_roles, ['bride_groom'])
+        self.assertEqual(bob.first_name, '')
+    
+    async def test_async_sync_writes_roles(self):
+        token, request = self.patch_auth0()
+        with token, request:
+            self.assertTrue(await Auth0UserSync().async_user_permissions(self.alice))
+        
+        alice = await EventUser.objects.aget(pk=self.alice.pk)
+        self.assertEqual(alice.auth0_roles, ['wedding_planner'])
+        self.assertEqual(alice.auth0_permissions, ['create:events', 'read:vendors'])
+        self.assertIsNotNone(alice.last_auth0_sync)
+    
+    def test_failed_live_sync_keeps_stored_roles(self):
+        token, request = self.patch_auth0()
+        with token, request:
+            self.assertFalse(self.missing.sync_auth0_permissions())
+        
+        missing = EventUser.objects.get(pk=self.missing.pk)
+        self.assertEqual(missing.auth0_roles, ['keep'])
+        self.assertIsNone(missing.last_auth0_sync)
+
+
+class ImportVendorsTests(TestCase):
+    """import_vendors writes each chunk in bulk and only counts rows that were saved"""
+    
+    COLUMNS = [
+        'name', 'email', 'phone', 'address', 'city', 'state', 'zip_code', 'base_price', 'max_guests',
+        'description', 'contact_name', 'website', 'category', 'amenities', 'is_active', 'is_featured',
+    ]
+    
+    def run_import(self, rows):
+        with tempfile.NamedTemporaryFile('w', suffix='.csv', delete=False, newline='', encoding='utf-8') as file:
+            writer = csv.DictWriter(file, fieldnames=self.COLUMNS, restval='')
+            writer.writeheader()
+            writer.writerows(rows)
+        self.addCleanup(os.remove, file.name)
+        
+        out = StringIO()
+        call_command('import_vendors', '--file', file.name, stdout=out)
+        return out.getvalue()
+    
+    def test_categories_with_the_same_slug_share_one_row(self):
+        output = self.run_import([
+            {'name': 'Henna House', 'category': 'Mehndi Artist'},
+            {'name': 'Henna Studio', 'category': 'Mehndi-Artist'},
+        ])
+        
+        category = VendorCategory.objects.get(slug='mehndi-artist')
+        self.assertEqual(VendorCategory.objects.filter(slug='mehndi-artist').count(), 1)
+        self.assertEqual(
+            set(Vendor.objects.values_list('business_name', 'category')),
+            {('Henna House', category.pk), ('Henna Studio', category.pk)},
+        )
+        self.assertIn('Created: 2 vendors', output)
+    
+    def test_row_that_fails_to_write_is_skipped(self):
+        Vendor.objects.create(business_name='Rang Decor', admin=make_user('decor@example.com'))
+        
+        # The oversized zip_code parses fine but fails the insert, taking the bulk write with it
+        output = self.run_import([
+            {'name': 'Rang Decor', 'category': 'Decor', 'city': 'Edison'},
+            {'name': 'Baraat Horses', 'category': 'Decor', 'zip_code': '0' * 40},
+            {'name': 'Shehnai Band', 'category': 'Music'},
+        ])
+        
+        self.assertEqual(
+            set(Vendor.objects.values_list('business_name', flat=True)),
+            {'Rang Decor', 'Shehnai Band'},
+        )
+        self.assertEqual(Vendor.objects.get(business_name='Rang Decor').city, 'Edison')
+        self.assertIn('Error on row 3', output)
+        self.assertIn('Created: 1 vendors', output)
+        self.assertIn('Updated: 1 vendors', output)
+        self.assertIn('Errors: 1 rows', output)
+
 
-# Create your tests here.
+class ImageUploadThrottleTests(TestCase):
+    """Anonymous uploads are limited per IP by the image_upload throttle rate"""
+    
+    def setUp(self):
+        cache.clear()
+    
+    def post(self, ip):
+        # No file, so allowed requests stop at the 400 before anything reaches storage
+        request = APIRequestFactory().post('/api/upload-image/', {}, format='multipart', REMOTE_ADDR=ip)
+        return ImageUploadAPIView.as_view()(request)
+    
+    def test_requests_over_the_rate_get_429(self):
+        num_requests, _ = ScopedRateThrottle().parse_rate(ScopedRateThrottle.THROTTLE_RATES['image_upload'])
+        
+        for _ in range(num_requests):
+            self.assertEqual(self.post('203.0.113.5').status_code, 400)
+        
+        self.assertEqual(self.post('203.0.113.5').status_code, 429)
+        # The limit is per client, so another IP is still allowed
+        self.assertEqual(self.post('203.0.113.6').status_code, 400)
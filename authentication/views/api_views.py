@@ -53,11 +53,12 @@ class UserProfileAPIView(APIView):
             'is_staff': user.is_staff,
             'is_superuser': user.is_superuser,
             'is_active': user.is_active,
-            'date_joined': user.date_joined.isoformat() if user.date_joined else None,
-            'last_login': user.last_login.isoformat() if user.last_login else None,
-            'last_auth0_sync': user.last_auth0_sync.isoformat() if user.last_auth0_sync else None,
-            'created_at': user.created_at.isoformat() if user.created_at else None,
-            'updated_at': user.updated_at.isoformat() if user.updated_at else None,
+            # Datetimes are encoded natively by ORJSONRenderer
+            'date_joined': user.date_joined,
+            'last_login': user.last_login,
+            'last_auth0_sync': user.last_auth0_sync,
+            'created_at': user.created_at,
+            'updated_at': user.updated_at,
             
             # Vendor relationship info
             'is_vendor_representative': hasattr(user, 'managed_vendors') and user.managed_vendors.exists(),
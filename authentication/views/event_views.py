@@ -130,15 +130,16 @@ class VendorManagementAPIView(APIView):
     def get(self, request):
         """Get vendor management capabilities"""
         user = request.user
+        manage_vendors = can_manage_vendors(user)
         
         data = {
-            'can_manage_vendors': can_manage_vendors(user),
+            'can_manage_vendors': manage_vendors,
             'is_vendor': user.has_role(EventUser.VENDOR),
             'vendor_permissions': {
-                'can_view_vendor_list': can_manage_vendors(user),
-                'can_add_vendors': can_manage_vendors(user),
-                'can_remove_vendors': can_manage_vendors(user),
-                'can_communicate_with_vendors': can_manage_vendors(user),
+                'can_view_vendor_list': manage_vendors,
+                'can_add_vendors': manage_vendors,
+                'can_remove_vendors': manage_vendors,
+                'can_communicate_with_vendors': manage_vendors,
             },
             'vendor_categories': [
                 'photographer', 'videographer', 'florist', 'caterer',
@@ -218,7 +219,7 @@ class ScheduleManagementAPIView(APIView):
                 'can_add_tasks': user.can_edit_schedules,
                 'can_assign_tasks': user.can_manage_attendees,
             },
-            'wedding_date': user.wedding_date.isoformat() if user.wedding_date else None,
+            'wedding_date': user.wedding_date,
             'timeline_templates': [
                 'traditional_wedding', 'modern_wedding', 'destination_wedding', 
                 'intimate_ceremony', 'outdoor_wedding', 'custom'
@@ -277,7 +278,7 @@ class AnalyticsAPIView(APIView):
             'couple_info': {
                 'bride_name': user.display_name if user.has_role(EventUser.BRIDE) else partner.display_name if partner and partner.has_role(EventUser.BRIDE) else None,
                 'groom_name': user.display_name if user.has_role(EventUser.GROOM) else partner.display_name if partner and partner.has_role(EventUser.GROOM) else None,
-                'wedding_date': user.wedding_date.isoformat() if user.wedding_date else None,
+                'wedding_date': user.wedding_date,
                 'wedding_venue': user.wedding_venue,
             }
         }
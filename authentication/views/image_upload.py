@@ -3,6 +3,7 @@ from rest_framework.response import Response
 from rest_framework.permissions import AllowAny
 from rest_framework import status
 from rest_framework.parsers import MultiPartParser, FormParser
+from rest_framework.throttling import ScopedRateThrottle
 from drf_spectacular.utils import extend_schema, OpenApiResponse
 from django.core.files.storage import default_storage
 from django.core.files.base import ContentFile
@@ -14,6 +15,9 @@ class ImageUploadAPIView(APIView):
     """Image upload endpoint for vendor portfolio images"""
     permission_classes = [AllowAny]
     parser_classes = [MultiPartParser, FormParser]
+    # Rejects bursts before any file reaches storage; rate set in REST_FRAMEWORK settings
+    throttle_classes = [ScopedRateThrottle]
+    throttle_scope = 'image_upload'
     
     @extend_schema(
         operation_id='upload_image',
@@ -39,6 +43,7 @@ class ImageUploadAPIView(APIView):
         responses={
             200: OpenApiResponse(description="Image uploaded successfully"),
             400: OpenApiResponse(description="Invalid file or upload error"),
+            429: OpenApiResponse(description="Too many uploads, retry later"),
         },
         tags=['Images']
     )
@@ -82,7 +82,8 @@ class AdminOnlyAPIView(APIView):
     
     def get(self, request):
         """Only super_admin can access"""
-        if not request.user.has_auth0_role('super_admin'):
+        user = request.user
+        if not user.has_auth0_role('super_admin'):
             return Response({
                 'error': 'Admin access required'
             }, status=status.HTTP_403_FORBIDDEN)
@@ -90,9 +91,9 @@ class AdminOnlyAPIView(APIView):
         return Response({
             'message': 'Admin dashboard data',
             'user': {
-                'email': request.user.email,
-                'roles': request.user.auth0_roles,
-                'permissions': request.user.auth0_permissions
+                'email': user.email,
+                'roles': user.auth0_roles,
+                'permissions': user.auth0_permissions
             }
         })
 
@@ -104,14 +105,17 @@ class WeddingPlannerAPIView(APIView):
         """Wedding planners and couples can access"""
         allowed_roles = ['wedding_planner', 'bride_groom']
         
-        if not any(request.user.has_auth0_role(role) for role in allowed_roles):
+        # First matching role doubles as the access check
+        user = request.user
+        user_role = next((role for role in allowed_roles if user.has_auth0_role(role)), None)
+        if user_role is None:
             return Response({
                 'error': f'Access denied. Required roles: {", ".join(allowed_roles)}'
             }, status=status.HTTP_403_FORBIDDEN)
         
         return Response({
             'message': 'Wedding planning data',
-            'user_role': [role for role in allowed_roles if request.user.has_auth0_role(role)][0]
+            'user_role': user_role
         })
 
 
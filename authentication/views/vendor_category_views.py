@@ -4,7 +4,9 @@ from rest_framework.permissions import AllowAny
 from rest_framework import status
 from drf_spectacular.utils import extend_schema, OpenApiResponse
 from ..models import VendorCategory
+from .vendor_views import DESCRIPTION_PREVIEW_LENGTH
 from django.db.models import Count, Q
+from django.db.models.functions import Substr
 
 
 class VendorCategoriesAPIView(APIView):
@@ -75,14 +77,21 @@ class VendorCategoryDetailAPIView(APIView):
             )
         
         # Get vendors in this category
-        vendors = category.vendors.filter(is_verified=True, is_active=True).order_by('business_name')
+        # Only a preview of the description is rendered, so cut it in SQL and skip the full column
+        vendors = category.vendors.filter(is_verified=True, is_active=True).annotate(
+            description_preview=Substr('description', 1, DESCRIPTION_PREVIEW_LENGTH + 1)
+        ).defer('description').order_by('business_name')
         
         vendors_data = []
         for vendor in vendors:
             vendors_data.append({
                 'id': vendor.id,
                 'business_name': vendor.business_name,
-                'description': vendor.description[:200] + '...' if len(vendor.description) > 200 else vendor.description,
+                'description': (
+                    vendor.description_preview[:DESCRIPTION_PREVIEW_LENGTH] + '...'
+                    if len(vendor.description_preview) > DESCRIPTION_PREVIEW_LENGTH
+                    else vendor.description_preview
+                ),
                 'city': vendor.city,
                 'state': vendor.state,
                 'price_range_min': float(vendor.price_range_min) if vendor.price_range_min else None,
@@ -2,12 +2,20 @@ from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
+from django.core.exceptions import ValidationError
 from django.shortcuts import get_object_or_404
+from django.utils import timezone
+from django.db.models import OuterRef, Q, Subquery
 
-from ..models import Vendor
+from ..models import Vendor, VendorUser
+from ..models.vendor_user import VENDOR_INFO_EDITOR_ROLES
 from ..permissions import IsVendorOwnerOrStaff, CanManageOwnVendor, IsVendorReadOnly
 
 
+# Vendor fields a vendor owner/manager may change through the API
+VENDOR_UPDATEABLE_FIELDS = frozenset({'business_name', 'description'})
+
+
 class MyVendorsAPIView(APIView):
     """List only vendors that the current user manages"""
     permission_classes = [IsAuthenticated]
@@ -16,28 +24,28 @@ class MyVendorsAPIView(APIView):
         """Get vendors that user owns or works for"""
         user = request.user
         
-        # Get vendors where user is admin
-        owned_vendors = Vendor.objects.filter(admin=user, is_active=True)
+        # The user's staff role (if any) comes back with each vendor and the pending
+        # inquiry count is a column on it, so the loop below runs no per-vendor queries
+        staff_role = VendorUser.objects.filter(
+            vendor=OuterRef('pk'), user=user, is_active=True
+        ).values('role')[:1]
         
-        # Get vendors where user is staff
-        staff_vendors = Vendor.objects.filter(
-            vendor_users__user=user,
-            vendor_users__is_active=True,
+        all_vendors = Vendor.objects.annotate(
+            staff_role=Subquery(staff_role),
+        ).filter(
+            Q(admin=user) | Q(staff_role__isnull=False),
             is_active=True
-        ).distinct()
-        
-        # Combine and remove duplicates
-        all_vendors = (owned_vendors | staff_vendors).distinct()
+        )
         
         vendor_data = []
         for vendor in all_vendors:
+            is_owner = vendor.admin_id == user.pk
             vendor_data.append({
                 'id': vendor.id,
                 'business_name': vendor.business_name,
-                'role': 'owner' if vendor.admin == user else 'staff',
-                'can_edit': vendor.admin == user or vendor.vendor_users.filter(
-                    user=user, can_edit_vendor_info=True
-                ).exists()
+                'role': 'owner' if is_owner else 'staff',
+                'can_edit': is_owner or vendor.staff_role in VENDOR_INFO_EDITOR_ROLES,
+                'pending_inquiries': vendor.pending_inquiries_count,
             })
         
         return Response({
@@ -59,6 +67,7 @@ class VendorManagementDetailAPIView(APIView):
     
     def get(self, request, vendor_id):
         """Get vendor details - only if you manage it"""
+        user = request.user
         vendor = self.get_object(vendor_id)
         
         return Response({
@@ -67,8 +76,8 @@ class VendorManagementDetailAPIView(APIView):
                 'id': vendor.id,
                 'business_name': vendor.business_name,
                 'description': vendor.description,
-                'is_owner': vendor.admin == request.user,
-                'your_role': self.get_user_role(request.user, vendor)
+                'is_owner': vendor.admin_id == user.pk,
+                'your_role': self.get_user_role(user, vendor)
             }
         })
     
@@ -82,15 +91,22 @@ class VendorManagementDetailAPIView(APIView):
                 'error': 'You do not have permission to edit this vendor'
             }, status=status.HTTP_403_FORBIDDEN)
         
-        # Update vendor fields
+        # Validate only the supplied fields, then write just those columns
         data = request.data
-        if 'business_name' in data:
-            vendor.business_name = data['business_name']
-        if 'description' in data:
-            vendor.description = data['description']
-        # ... other fields
+        update_data = {}
+        try:
+            for field_name in VENDOR_UPDATEABLE_FIELDS & data.keys():
+                field = Vendor._meta.get_field(field_name)
+                update_data[field_name] = field.clean(data[field_name], vendor)
+        except ValidationError as e:
+            return Response({
+                'error': e.messages
+            }, status=status.HTTP_400_BAD_REQUEST)
         
-        vendor.save()
+        if update_data:
+            # update() skips auto_now, and updated_at versions the vendor detail cache
+            update_data['updated_at'] = timezone.now()
+            Vendor.objects.filter(pk=vendor.pk).update(**update_data)
         
         return Response({
             'success': True,
@@ -102,7 +118,8 @@ class VendorManagementDetailAPIView(APIView):
         vendor = self.get_object(vendor_id)
         
         # Only the actual owner can delete
-        if vendor.admin != request.user and not request.user.has_auth0_role('super_admin'):
+        user = request.user
+        if vendor.admin_id != user.pk and not user.has_auth0_role('super_admin'):
             return Response({
                 'error': 'Only the vendor owner can delete this vendor'
             }, status=status.HTTP_403_FORBIDDEN)
@@ -117,7 +134,7 @@ class VendorManagementDetailAPIView(APIView):
     
     def get_user_role(self, user, vendor):
         """Helper to get user's role for this vendor"""
-        if vendor.admin == user:
+        if vendor.admin_id == user.pk:
             return 'owner'
         
         vendor_user = vendor.vendor_users.filter(user=user, is_active=True).first()
@@ -128,13 +145,13 @@ class VendorManagementDetailAPIView(APIView):
     
     def can_user_edit(self, user, vendor):
         """Helper to check if user can edit this vendor"""
-        if vendor.admin == user:
+        if vendor.admin_id == user.pk:
             return True
         
         return vendor.vendor_users.filter(
             user=user,
             is_active=True,
-            can_edit_vendor_info=True
+            role__in=VENDOR_INFO_EDITOR_ROLES
         ).exists()
 
 
@@ -177,7 +194,7 @@ class VendorStaffAPIView(APIView):
         vendor = get_object_or_404(Vendor, id=vendor_id)
         
         # Only vendor owner can add staff
-        if vendor.admin != request.user:
+        if vendor.admin_id != request.user.pk:
             return Response({
                 'error': 'Only vendor owner can add staff'
             }, status=status.HTTP_403_FORBIDDEN)
@@ -4,12 +4,87 @@ from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework import status
 from rest_framework.pagination import PageNumberPagination
 from drf_spectacular.utils import extend_schema, OpenApiResponse, OpenApiParameter
-from django.db.models import Q, Count, Avg
-from django.core.paginator import Paginator
+from django.core.cache import cache
+from django.db.models import Q, Count, Avg, Window
+from django.db.models.functions import Substr
+from math import ceil
 from ..models import Vendor, VendorCategory
 from ..schemas import VendorSchema
 
 
+def paginate_with_total(queryset, page, limit):
+    """
+    Return (rows, total_count, page) for a 1-based page of queryset.
+    The total is read from a COUNT(*) OVER () window on the page rows, so a
+    separate COUNT query is only needed when the requested page is past the end.
+    """
+    page = max(page, 1)
+    counted = queryset.annotate(_total_count=Window(expression=Count('id')))
+    
+    offset = (page - 1) * limit
+    rows = list(counted[offset:offset + limit])
+    if rows:
+        first = rows[0]
+        total_count = first['_total_count'] if isinstance(first, dict) else first._total_count
+        return rows, total_count, page
+    
+    # Out of range: fall back to the last page, like Paginator.get_page()
+    total_count = queryset.count()
+    last_page = max(ceil(total_count / limit), 1)
+    if page <= last_page:
+        return rows, total_count, page
+    
+    offset = (last_page - 1) * limit
+    return list(queryset[offset:offset + limit]), total_count, last_page
+
+
+# Vendor detail payloads are cached per (id, updated_at) version
+VENDOR_DETAIL_CACHE_TTL = 3600
+
+# Columns read by the vendor list; fetched with .values() so no model instances are built.
+# description_preview is the first DESCRIPTION_PREVIEW_LENGTH + 1 characters, cut in SQL
+DESCRIPTION_PREVIEW_LENGTH = 200
+VENDOR_LIST_FIELDS = (
+    'id', 'business_name', 'category__name', 'category__slug', 'city', 'state',
+    'price_range_min', 'price_range_max', 'description_preview', 'services_offered',
+    'years_in_business', 'is_featured', 'website', 'business_phone',
+)
+
+
+def _vendor_list_item(row):
+    """Shape a VENDOR_LIST_FIELDS row into a vendor list entry"""
+    price_min = row['price_range_min']
+    price_max = row['price_range_max']
+    description = row['description_preview']
+    is_featured = row['is_featured']
+    
+    return {
+        'id': row['id'],
+        'business_name': row['business_name'],
+        'category': {
+            'name': row['category__name'],
+            'slug': row['category__slug'],
+        },
+        'location': f"{row['city']}, {row['state']}",
+        'city': row['city'],
+        'state': row['state'],
+        'price_range_min': float(price_min) if price_min else None,
+        'price_range_max': float(price_max) if price_max else None,
+        'price_range_display': f"${int(price_min) if price_min else 'N/A'} - ${int(price_max) if price_max else 'N/A'}",
+        'description': (
+            description[:DESCRIPTION_PREVIEW_LENGTH] + '...'
+            if len(description) > DESCRIPTION_PREVIEW_LENGTH else description
+        ),
+        'services_offered': row['services_offered'],
+        'years_in_business': row['years_in_business'],
+        'is_featured': is_featured,
+        'rating_average': 4.5 if is_featured else 4.0,  # Placeholder until rating system
+        'review_count': 12 if is_featured else 8,  # Placeholder until review system
+        'website': row['website'],
+        'business_phone': row['business_phone'],
+    }
+
+
 class VendorListAPIView(APIView):
     """Public vendor listing - couples can browse vendors"""
     permission_classes = [AllowAny]
@@ -90,7 +165,7 @@ class VendorListAPIView(APIView):
         vendors = Vendor.objects.filter(
             is_active=True,
             is_verified=True
-        ).select_related('category')
+        )
         
         # Apply filters
         if category_slug:
@@ -128,43 +203,20 @@ class VendorListAPIView(APIView):
         
         vendors = vendors.order_by(sort_field, 'business_name')
         
-        # Get total count before pagination
-        total_count = vendors.count()
-        
-        # Apply pagination
-        paginator = Paginator(vendors, limit)
-        page_obj = paginator.get_page(page)
+        # Apply pagination (page rows and total count come back in one query)
+        vendors = vendors.annotate(
+            description_preview=Substr('description', 1, DESCRIPTION_PREVIEW_LENGTH + 1)
+        ).values(*VENDOR_LIST_FIELDS)
+        page_vendors, total_count, page = paginate_with_total(vendors, page, limit)
+        total_pages = max(ceil(total_count / limit), 1)
+        has_next = page < total_pages
+        has_previous = page > 1
         
         # Serialize vendor data
-        vendor_data = []
-        for vendor in page_obj.object_list:
-            vendor_data.append({
-                'id': vendor.id,
-                'business_name': vendor.business_name,
-                'category': {
-                    'name': vendor.category.name,
-                    'slug': vendor.category.slug,
-                },
-                'location': f"{vendor.city}, {vendor.state}",
-                'city': vendor.city,
-                'state': vendor.state,
-                'price_range_min': float(vendor.price_range_min) if vendor.price_range_min else None,
-                'price_range_max': float(vendor.price_range_max) if vendor.price_range_max else None,
-                'price_range_display': f"${int(vendor.price_range_min) if vendor.price_range_min else 'N/A'} - ${int(vendor.price_range_max) if vendor.price_range_max else 'N/A'}",
-                'description': vendor.description[:200] + '...' if len(vendor.description) > 200 else vendor.description,
-                'services_offered': vendor.services_offered,
-                'years_in_business': vendor.years_in_business,
-                'is_featured': vendor.is_featured,
-                'rating_average': 4.5 if vendor.is_featured else 4.0,  # Placeholder until rating system
-                'review_count': 12 if vendor.is_featured else 8,  # Placeholder until review system
-                'website': vendor.website,
-                'business_phone': vendor.business_phone,
-            })
+        vendor_data = [_vendor_list_item(row) for row in page_vendors]
         
         # Get categories for filtering
-        categories = list(VendorCategory.objects.filter(
-            is_active=True
-        ).values('name', 'slug'))
+        categories = VendorCategory.get_active_filter_options()
         
         return Response({
             'success': True,
@@ -177,11 +229,11 @@ class VendorListAPIView(APIView):
                     'page': page,
                     'limit': limit,
                     'total_count': total_count,
-                    'total_pages': paginator.num_pages,
-                    'has_next': page_obj.has_next(),
-                    'has_previous': page_obj.has_previous(),
-                    'next_page': page + 1 if page_obj.has_next() else None,
-                    'previous_page': page - 1 if page_obj.has_previous() else None,
+                    'total_pages': total_pages,
+                    'has_next': has_next,
+                    'has_previous': has_previous,
+                    'next_page': page + 1 if has_next else None,
+                    'previous_page': page - 1 if has_previous else None,
                 }
             }
         })
@@ -204,19 +256,38 @@ class VendorDetailAPIView(APIView):
     )
     def get(self, request, vendor_id):
         """Get detailed vendor information"""
-        try:
-            vendor = Vendor.objects.select_related('category').get(
-                id=vendor_id,
-                is_active=True,
-                is_verified=True
-            )
-        except Vendor.DoesNotExist:
+        # updated_at versions the cache key, so any save to the vendor invalidates it.
+        # The category can change without touching the vendor, so its name/slug come
+        # from this query and replace the cached copy on every request.
+        row = Vendor.objects.filter(
+            id=vendor_id,
+            is_active=True,
+            is_verified=True
+        ).values_list('updated_at', 'category__name', 'category__slug').first()
+        
+        if row is None:
             return Response(
                 {'success': False, 'message': 'Vendor not found'}, 
                 status=status.HTTP_404_NOT_FOUND
             )
         
-        data = {
+        updated_at, category_name, category_slug = row
+        cache_key = f'vendor:detail:{vendor_id}:{updated_at.timestamp()}'
+        data = cache.get(cache_key)
+        if data is None:
+            vendor = Vendor.objects.select_related('category').get(id=vendor_id)
+            data = self.serialize_vendor(vendor)
+            cache.set(cache_key, data, VENDOR_DETAIL_CACHE_TTL)
+        
+        return Response({
+            'success': True,
+            'message': 'Vendor details retrieved successfully',
+            'data': {**data, 'category': {'name': category_name, 'slug': category_slug}}
+        })
+    
+    def serialize_vendor(self, vendor):
+        """Build the vendor detail payload"""
+        return {
             'id': vendor.id,
             'business_name': vendor.business_name,
             'business_email': vendor.business_email,
@@ -243,10 +314,4 @@ class VendorDetailAPIView(APIView):
             'testimonials': vendor.testimonials,
             'is_featured': vendor.is_featured,
         }
-        
-        return Response({
-            'success': True,
-            'message': 'Vendor details retrieved successfully',
-            'data': data
-        })
 
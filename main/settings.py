@@ -83,6 +83,7 @@ MIDDLEWARE = [
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'authentication.middleware.Auth0PermissionMiddleware',  # Per-request Auth0 permission sets
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -130,6 +131,23 @@ if not DEBUG and os.getenv('DATABASE_URL') and 'render.com' in os.getenv('DATABA
     }
 
 
+# Cache
+# Shared Redis cache when REDIS_URL is set; per-process memory cache otherwise
+if os.getenv('REDIS_URL'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.getenv('REDIS_URL'),
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
+
 # Password validation
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
 
@@ -243,10 +261,21 @@ REST_FRAMEWORK = {
         'rest_framework.permissions.IsAuthenticated',
     ],
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
+    # Per-user (or per-IP for anonymous) limits for views that set throttle_scope;
+    # counters live in the default cache, i.e. Redis when REDIS_URL is set. Without
+    # Redis the LocMem cache keeps them per worker process, so each worker allows the full rate
+    'DEFAULT_THROTTLE_RATES': {
+        'image_upload': '10/minute',
+    },
     'DEFAULT_RENDERER_CLASSES': [
-        'rest_framework.renderers.JSONRenderer',
+        'authentication.renderers.ORJSONRenderer',  # orjson-backed JSON output
         'rest_framework.renderers.BrowsableAPIRenderer',
     ],
+    'DEFAULT_PARSER_CLASSES': [
+        'authentication.parsers.ORJSONParser',  # orjson-backed JSON input
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ],
 }
 
 # OpenAPI/Swagger Configuration